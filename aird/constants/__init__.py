@@ -284,31 +284,33 @@ MAX_READABLE_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
 # Default line window for /files/... viewer when no ?end_line= is supplied (protects DOM from huge renders)
 DEFAULT_FILE_VIEW_LINE_LIMIT = 1000
 # Default whitelist for uploads; also used as the list of options in admin when "allow all" is off
-ALLOWED_UPLOAD_EXTENSIONS = {
-    ".txt",
-    ".log",
-    ".md",
-    ".json",
-    ".xml",
-    ".yaml",
-    ".yml",
-    ".csv",
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".gif",
-    ".ico",
-    ".mp4",
-    ".webm",
-    ".ogg",
-    ".mp3",
-    ".wav",
-    ".pdf",
-    ".zip",
-    ".gz",
-    ".tar",
-    ".bz2",
-}
+ALLOWED_UPLOAD_EXTENSIONS: frozenset = frozenset(
+    {
+        ".txt",
+        ".log",
+        ".md",
+        ".json",
+        ".xml",
+        ".yaml",
+        ".yml",
+        ".csv",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".ico",
+        ".mp4",
+        ".webm",
+        ".ogg",
+        ".mp3",
+        ".wav",
+        ".pdf",
+        ".zip",
+        ".gz",
+        ".tar",
+        ".bz2",
+    }
+)
 # Runtime set of allowed extensions (loaded from DB; used when allow_all_file_types is off)
 UPLOAD_ALLOWED_EXTENSIONS = set(ALLOWED_UPLOAD_EXTENSIONS)
 
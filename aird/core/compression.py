@@ -87,18 +87,20 @@ def _parse_accept_q_value(qpart: str) -> float:
         return 0.0
 
 
-def _parse_accept_encoding_tokens(accept_header: str) -> dict[str, float]:
+_NEGOTIABLE_CODECS = ("zstd", "gzip")
+
+
+def _parse_accept_encoding_tokens(
+    accept_header: str, wanted: frozenset[str] | None = None
+) -> dict[str, float]:
+    """Single pass over Accept-Encoding; q-values are only parsed for *wanted* codecs."""
     tokens: dict[str, float] = {}
     for part in accept_header.split(","):
-        piece = part.strip()
-        if not piece:
-            continue
-        if ";" in piece:
-            name, _, qpart = piece.partition(";")
-            qval = _parse_accept_q_value(qpart)
-        else:
-            name, qval = piece, 1.0
+        name, _, qpart = part.partition(";")
         name = name.strip().lower()
+        if not name or (wanted is not None and name not in wanted):
+            continue
+        qval = _parse_accept_q_value(qpart) if qpart else 1.0
         if qval > 0:
             tokens[name] = max(tokens.get(name, 0.0), qval)
     return tokens
@@ -109,8 +111,11 @@ def negotiate_encoding(accept_header: str | None, enabled: list[str] | None = No
     if not accept_header:
         return None
     allowed = enabled or ["gzip"]
-    tokens = _parse_accept_encoding_tokens(accept_header)
-    for codec in ("zstd", "gzip"):
+    wanted = frozenset(c for c in _NEGOTIABLE_CODECS if c in allowed)
+    if not wanted:
+        return None
+    tokens = _parse_accept_encoding_tokens(accept_header, wanted)
+    for codec in _NEGOTIABLE_CODECS:
         if codec in allowed and codec in tokens:
             if codec == "zstd" and not _zstd_available():
                 continue
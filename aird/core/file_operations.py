@@ -12,6 +12,8 @@ from aird.cloud import CloudProviderError
 
 logger = logging.getLogger(__name__)
 
+_UNSAFE_CLOUD_FILENAME_CHAR_RE = re.compile(r"[^A-Za-z0-9._-]")
+
 
 def get_all_files_recursive(root_path: str, base_path: str = "") -> list:
     """Recursively get all files in a directory via os.walk."""
@@ -241,7 +243,7 @@ def sanitize_cloud_filename(name: str | None) -> str:
     """Sanitize a filename for safe cloud storage"""
     candidate = (name or "cloud_file").strip()
     candidate = candidate.replace(os.sep, "_").replace("/", "_")
-    candidate = re.sub(r"[^A-Za-z0-9._-]", "_", candidate)
+    candidate = _UNSAFE_CLOUD_FILENAME_CHAR_RE.sub("_", candidate)
     candidate = candidate.strip("._")
     if not candidate:
         candidate = "cloud_file"
@@ -12,7 +12,7 @@ _CONTENT_RANGE_RE = re.compile(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ByteRange:
     start: int
     end: int  # inclusive
@@ -118,6 +118,13 @@ class MMapFileHandler:
         """Determine if mmap should be used based on file size"""
         return file_size >= MMAP_MIN_SIZE
 
+    @staticmethod
+    def file_contains(file_path: str, search_bytes: bytes) -> bool:
+        """Return True if search_bytes occurs anywhere in the file (one mmap scan)."""
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(search_bytes) != -1
+
     @staticmethod
     async def serve_file_chunk(
         file_path: str, start: int = 0, end: int = None, chunk_size: int = CHUNK_SIZE
@@ -220,17 +227,17 @@ def _search_small_file(
     """Search in small file using traditional file reading."""
     results = []
     with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        # Most files don't match; one substring test skips line enumeration.
+        if search_term not in f.read():
+            return results
+        f.seek(0)
         for line_num, line in enumerate(f, 1):
             if search_term in line:
                 results.append(
                     {
                         "line_number": line_num,
                         "line_content": line.rstrip("\n"),
-                        "match_positions": [
-                            i
-                            for i in range(len(line))
-                            if line[i:].startswith(search_term)
-                        ],
+                        "match_positions": _match_positions(line, search_term),
                     }
                 )
                 if len(results) >= max_results:
@@ -238,43 +245,41 @@ def _search_small_file(
     return results
 
 
+def _count_newlines(mm, start: int, end: int) -> int:
+    """Count newlines in mm[start:end], copying at most CHUNK_SIZE bytes at a time."""
+    count = 0
+    for pos in range(start, end, CHUNK_SIZE):
+        count += mm[pos:min(pos + CHUNK_SIZE, end)].count(b"\n")
+    return count
+
+
 def _search_mmap_file(
     file_path: str, search_term: str, search_bytes: bytes, max_results: int
 ) -> list[dict]:
-    """Search in large file using mmap."""
+    """Search in large file using mmap, jumping from hit to hit."""
     results = []
+    if b"\n" in search_bytes:
+        # Matches never span lines.
+        return results
     with open(file_path, "rb") as f:
         with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-            current_pos = 0
             line_number = 1
-            while current_pos < len(mm) and len(results) < max_results:
-                newline_pos = mm.find(b"\n", current_pos)
-                if newline_pos == -1:
-                    line_bytes = mm[current_pos:]
-                    if search_bytes in line_bytes:
-                        line_content = line_bytes.decode("utf-8", errors="replace")
-                        results.append(
-                            {
-                                "line_number": line_number,
-                                "line_content": line_content,
-                                "match_positions": _match_positions(
-                                    line_content, search_term
-                                ),
-                            }
-                        )
-                    break
-                line_bytes = mm[current_pos:newline_pos]
-                if search_bytes in line_bytes:
-                    line_content = line_bytes.decode("utf-8", errors="replace")
-                    results.append(
-                        {
-                            "line_number": line_number,
-                            "line_content": line_content,
-                            "match_positions": _match_positions(
-                                line_content, search_term
-                            ),
-                        }
-                    )
-                current_pos = newline_pos + 1
-                line_number += 1
+            counted_to = 0
+            hit = mm.find(search_bytes)
+            while -1 < hit < len(mm) and len(results) < max_results:
+                line_start = mm.rfind(b"\n", 0, hit) + 1
+                line_end = mm.find(b"\n", hit + len(search_bytes))
+                if line_end == -1:
+                    line_end = len(mm)
+                line_number += _count_newlines(mm, counted_to, line_start)
+                counted_to = line_start
+                line_content = mm[line_start:line_end].decode("utf-8", errors="replace")
+                results.append(
+                    {
+                        "line_number": line_number,
+                        "line_content": line_content,
+                        "match_positions": _match_positions(line_content, search_term),
+                    }
+                )
+                hit = mm.find(search_bytes, line_end + 1)
     return results
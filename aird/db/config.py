@@ -17,11 +17,10 @@ def load_feature_flags(conn: sqlite3.Connection) -> dict:
 def save_feature_flags(conn: sqlite3.Connection, flags: dict) -> None:
     try:
         with conn:
-            for k, v in flags.items():
-                conn.execute(
-                    "REPLACE INTO feature_flags (key, value) VALUES (?, ?)",
-                    (k, 1 if v else 0),
-                )
+            conn.executemany(
+                "REPLACE INTO feature_flags (key, value) VALUES (?, ?)",
+                [(k, 1 if v else 0) for k, v in flags.items()],
+            )
     except Exception:
         logger.debug("save_feature_flags failed", exc_info=True)
 
@@ -39,11 +38,10 @@ def save_upload_config(conn: sqlite3.Connection, config: dict) -> None:
     """Save upload configuration to SQLite database."""
     try:
         with conn:
-            for key, value in config.items():
-                conn.execute(
-                    "INSERT OR REPLACE INTO upload_config (key, value) VALUES (?, ?)",
-                    (key, int(value)),
-                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO upload_config (key, value) VALUES (?, ?)",
+                [(key, int(value)) for key, value in config.items()],
+            )
     except Exception:
         logger.warning("save_upload_config failed", exc_info=True)
 
@@ -66,11 +64,10 @@ def save_server_config(
     """Persist runtime config and return its monotonic revision."""
     try:
         with conn:
-            for key, value in config.items():
-                conn.execute(
-                    "INSERT OR REPLACE INTO server_config (key, value) VALUES (?, ?)",
-                    (str(key), str(value)),
-                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO server_config (key, value) VALUES (?, ?)",
+                [(str(key), str(value)) for key, value in config.items()],
+            )
             row = conn.execute(
                 "SELECT value FROM server_config WHERE key = 'revision'"
             ).fetchone()
@@ -102,11 +99,14 @@ def save_allowed_extensions(conn: sqlite3.Connection, extensions: set) -> None:
     try:
         with conn:
             conn.execute("DELETE FROM upload_allowed_extensions")
-            for ext in extensions:
-                if ext and isinstance(ext, str) and ext.startswith("."):
-                    conn.execute(
-                        "INSERT INTO upload_allowed_extensions (ext) VALUES (?)", (ext,)
-                    )
+            conn.executemany(
+                "INSERT INTO upload_allowed_extensions (ext) VALUES (?)",
+                [
+                    (ext,)
+                    for ext in extensions
+                    if ext and isinstance(ext, str) and ext.startswith(".")
+                ],
+            )
     except Exception:
         logger.debug("save_allowed_extensions failed", exc_info=True)
 
@@ -124,10 +124,9 @@ def save_websocket_config(conn: sqlite3.Connection, config: dict) -> None:
     """Save WebSocket configuration to SQLite database."""
     try:
         with conn:
-            for key, value in config.items():
-                conn.execute(
-                    "INSERT OR REPLACE INTO websocket_config (key, value) VALUES (?, ?)",
-                    (key, int(value)),
-                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO websocket_config (key, value) VALUES (?, ?)",
+                [(key, int(value)) for key, value in config.items()],
+            )
     except Exception:
         logger.debug("save_websocket_config failed", exc_info=True)
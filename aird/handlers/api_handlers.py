@@ -50,6 +50,8 @@ from aird.utils.util import (
     get_current_feature_flags,
     augment_with_shared_status,
     share_relevant_for_viewers_file_tree,
+    _json_dumps,
+    _json_loads,
 )
 from aird.core.security import (
     is_within_root,
@@ -62,6 +64,23 @@ from aird.config import (
 from aird.core.mmap_handler import MMapFileHandler
 import aird.constants as constants_module
 
+# Characters per aiofiles read when scanning file contents for super search.
+# Each read is a thread-pool round trip, so read blocks rather than lines.
+_SEARCH_READ_CHARS = 64 * 1024
+# Matches per "match_batch" frame; batches are also flushed after every read block.
+_SEARCH_MATCH_BATCH = 64
+# Files searched at once during a walk, and how many search tasks may be in flight.
+_SEARCH_FILE_CONCURRENCY = 8
+_SEARCH_FILE_WINDOW = 64
+# Fixed super-search error frames, encoded once rather than per bad message.
+_SEARCH_INVALID_JSON_MSG = json.dumps({"type": "error", "message": "Invalid JSON format"})
+_SEARCH_MISSING_PARAMS_MSG = json.dumps(
+    {"type": "error", "message": "Both pattern and search_text are required"}
+)
+_SEARCH_PARAMS_TOO_LONG_MSG = json.dumps(
+    {"type": "error", "message": "Search parameters too long"}
+)
+
 
 class FeatureFlagSocketHandler(
     ManagedWebSocketMixin, tornado.websocket.WebSocketHandler
@@ -81,7 +100,7 @@ class FeatureFlagSocketHandler(
             return
 
         current_flags = self._get_current_feature_flags()
-        self.write_message(json.dumps(current_flags))
+        self.write_message(_json_dumps(current_flags))
 
     def check_origin(self, origin):
         return is_valid_websocket_origin(self, origin)
@@ -92,7 +111,7 @@ class FeatureFlagSocketHandler(
     @classmethod
     def send_updates(cls):
         current_flags = get_current_feature_flags()
-        cls.connection_manager.broadcast_message(json.dumps(current_flags))
+        cls.connection_manager.broadcast_message(_json_dumps(current_flags))
 
 
 class FeatureFlagAPIHandler(BaseHandler):
@@ -519,6 +538,9 @@ class SuperSearchWebSocketHandler(
     def __init__(self, application, request, **kwargs):
         super().__init__(application, request, **kwargs)
         self.search_task = None
+        self._cancel_task = None
+        # Latest search requested while the previous one is still winding down.
+        self._pending_search = None
         self.stop_event = asyncio.Event()
 
     def get_current_user(self):
@@ -531,7 +553,7 @@ class SuperSearchWebSocketHandler(
         """Send auth_required JSON and close the WebSocket."""
         try:
             self.write_message(
-                json.dumps(
+                _json_dumps(
                     {
                         "type": "auth_required",
                         "message": message,
@@ -578,34 +600,23 @@ class SuperSearchWebSocketHandler(
             return
 
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
         except json.JSONDecodeError:
-            self.write_message(
-                json.dumps({"type": "error", "message": "Invalid JSON format"})
-            )
+            self.write_message(_SEARCH_INVALID_JSON_MSG)
             return
         pattern = data.get("pattern")
         search_text = data.get("search_text")
         if not pattern or not search_text:
-            self.write_message(
-                json.dumps(
-                    {
-                        "type": "error",
-                        "message": "Both pattern and search_text are required",
-                    }
-                )
-            )
+            self.write_message(_SEARCH_MISSING_PARAMS_MSG)
             return
         try:
             pattern, search_text = validate_ws_search(pattern, search_text)
         except InputTooLongError:
-            self.write_message(
-                json.dumps({"type": "error", "message": "Search parameters too long"})
-            )
+            self.write_message(_SEARCH_PARAMS_TOO_LONG_MSG)
             return
         glob_err = validate_super_search_glob(pattern)
         if glob_err:
-            self.write_message(json.dumps({"type": "error", "message": glob_err}))
+            self.write_message(_json_dumps({"type": "error", "message": glob_err}))
             return
 
         # Validate authentication again before starting search
@@ -621,13 +632,19 @@ class SuperSearchWebSocketHandler(
 
         search_mode = data.get("search_mode", "content")
 
-        if self.search_task and not self.search_task.done():
+        # A restart still waiting to run counts as busy even once the old
+        # search has finished, or the two would both start a search.
+        restart_pending = self._cancel_task is not None and not self._cancel_task.done()
+        if restart_pending or (self.search_task and not self.search_task.done()):
             self.stop_event.set()
-            self._cancel_task = asyncio.create_task(
-                self._await_cancellation_and_start_new(
-                    (pattern, search_text, search_mode)
+            # Coalesce rapid re-queries into one restart: only the newest query
+            # runs once the current search stops, and at most one restart task
+            # is ever outstanding per connection.
+            self._pending_search = (pattern, search_text, search_mode)
+            if not restart_pending:
+                self._cancel_task = asyncio.create_task(
+                    self._await_cancellation_and_start_new(self._pending_search)
                 )
-            )
         else:
             self.stop_event.clear()
             self.search_task = asyncio.create_task(
@@ -635,17 +652,12 @@ class SuperSearchWebSocketHandler(
             )
 
     async def _await_cancellation_and_start_new(self, args):
-        try:
-            await self.search_task
-        except asyncio.CancelledError:
-            self.stop_event.clear()
-            pattern, search_text, search_mode = args
-            self.search_task = asyncio.create_task(
-                self.perform_search(pattern, search_text, search_mode)
-            )
-            raise
+        # asyncio.wait returns however the old search ends; only cancelling
+        # this task itself (on_close) raises here, and then nothing restarts.
+        await asyncio.wait([self.search_task])
         self.stop_event.clear()
-        pattern, search_text, search_mode = args
+        pattern, search_text, search_mode = self._pending_search or args
+        self._pending_search = None
         self.search_task = asyncio.create_task(
             self.perform_search(pattern, search_text, search_mode)
         )
@@ -662,7 +674,7 @@ class SuperSearchWebSocketHandler(
     def _emit_scanning(self, rel_path_str: str, files_searched: int) -> None:
         try:
             self.write_message(
-                json.dumps(
+                _json_dumps(
                     {
                         "type": "scanning",
                         "file_path": rel_path_str,
@@ -681,24 +693,52 @@ class SuperSearchWebSocketHandler(
     async def _search_file_content(
         self, file_path: pathlib.Path, rel_path_str: str, search_text: str
     ) -> int:
-        """Search file for search_text; yield matches via send_match. Returns match count. May raise CancelledError."""
-        if file_path.stat().st_size > MAX_READABLE_FILE_SIZE:
+        """Search file for search_text; stream matches via send_match_batch. Returns match count. May raise CancelledError."""
+        file_size = file_path.stat().st_size
+        if file_size > MAX_READABLE_FILE_SIZE:
             return 0
+        # Most large files don't match; rule them out with one mmap scan off the loop.
+        # The scan below decodes with errors="replace", so invalid bytes never
+        # vanish from between matched characters and the raw-bytes test agrees
+        # with it -- unless the term itself contains U+FFFD.
+        if MMapFileHandler.should_use_mmap(file_size) and "\ufffd" not in search_text:
+            try:
+                found = await asyncio.to_thread(
+                    MMapFileHandler.file_contains, str(file_path), search_text.encode("utf-8")
+                )
+            except (OSError, ValueError):
+                found = True
+            if not found:
+                return 0
         match_count = 0
+        line_num = 0
+        tail = ""
         async with aiofiles.open(
-            file_path, "r", encoding="utf-8", errors="ignore"
+            file_path, "r", encoding="utf-8", errors="replace"
         ) as f:
-            line_num = 0
             while True:
-                line = await f.readline()
-                if not line:
+                block = await f.read(_SEARCH_READ_CHARS)
+                if block:
+                    # Carry the trailing partial line into the next block.
+                    lines = (tail + block).split("\n")
+                    tail = lines.pop()
+                else:
+                    lines = [tail] if tail else []
+                pending = []
+                for line in lines:
+                    line_num += 1
+                    if self.stop_event.is_set():
+                        self.send_match_batch(rel_path_str, pending, search_text)
+                        raise asyncio.CancelledError
+                    if search_text in line:
+                        pending.append((line_num, line.strip()))
+                        match_count += 1
+                        if len(pending) >= _SEARCH_MATCH_BATCH:
+                            self.send_match_batch(rel_path_str, pending, search_text)
+                            pending = []
+                self.send_match_batch(rel_path_str, pending, search_text)
+                if not block:
                     break
-                line_num += 1
-                if self.stop_event.is_set():
-                    raise asyncio.CancelledError
-                if search_text in line:
-                    self.send_match(rel_path_str, line_num, line.strip(), search_text)
-                    match_count += 1
         return match_count
 
     def _match_filename_search(self, rel_path_str: str, filename: str, search_text: str) -> bool:
@@ -755,24 +795,29 @@ class SuperSearchWebSocketHandler(
             logging.debug("Error searching file %s: %s", file_path, other_err)
             return 0, True
 
-    async def _process_walk_file(
-        self, file_path, root_path, filename, normalized_pattern,
-        search_text, files_searched, search_mode, files_visited,
-    ) -> tuple[int, bool]:
-        """Process one file during walk. Returns (match_delta, counted)."""
+    async def _walk_file_rel_path(
+        self, file_path, root_path, filename, normalized_pattern, files_visited,
+    ) -> str | None:
+        """Return the file's relative path if it matches the glob, else None."""
         try:
             rel_path_str = str(file_path.relative_to(root_path)).replace("\\", "/")
         except ValueError:
-            return 0, False
-        glob_match = self._file_matches_pattern(rel_path_str, filename, normalized_pattern)
-        if not glob_match:
+            return None
+        if not self._file_matches_pattern(rel_path_str, filename, normalized_pattern):
             if files_visited == 1 or files_visited % SuperSearchWebSocketHandler._walk_scan_interval == 0:
                 await self._emit_walk_tick(rel_path_str, files_visited)
-            return 0, False
-        return await self._search_one_file(
-            file_path, root_path, filename, normalized_pattern,
-            search_text, files_searched + 1, search_mode, rel_path_str=rel_path_str,
-        )
+            return None
+        return rel_path_str
+
+    @staticmethod
+    async def _collect_searches(running: set, return_when) -> int:
+        """Wait for per-file search tasks, drop finished ones from ``running``; returns their matches."""
+        if not running:
+            return 0
+        done, _pending = await asyncio.wait(running, return_when=return_when)
+        running.difference_update(done)
+        # result() re-raises a search's CancelledError or unexpected error.
+        return sum(task.result()[0] for task in done)
 
     async def _run_search_walk(
         self,
@@ -785,23 +830,52 @@ class SuperSearchWebSocketHandler(
         matches = 0
         files_searched = 0
         files_visited = 0
-        for dirpath, _dirnames, filenames in os.walk(root_path, followlinks=False):
-            if self.stop_event.is_set():
-                raise asyncio.CancelledError
-            for filename in filenames:
+        semaphore = asyncio.Semaphore(_SEARCH_FILE_CONCURRENCY)
+        running = set()
+
+        async def bounded_search(*args, **kwargs):
+            async with semaphore:
+                return await self._search_one_file(*args, **kwargs)
+
+        try:
+            for dirpath, _dirnames, filenames in os.walk(root_path, followlinks=False):
                 if self.stop_event.is_set():
                     raise asyncio.CancelledError
-                file_path = pathlib.Path(dirpath) / filename
-                files_visited += 1
-                match_delta, counted = await self._process_walk_file(
-                    file_path, root_path, filename, normalized_pattern,
-                    search_text, files_searched, search_mode, files_visited,
-                )
-                matches += match_delta
-                if counted:
+                for filename in filenames:
+                    if self.stop_event.is_set():
+                        raise asyncio.CancelledError
+                    file_path = pathlib.Path(dirpath) / filename
+                    files_visited += 1
+                    rel_path_str = await self._walk_file_rel_path(
+                        file_path, root_path, filename, normalized_pattern, files_visited
+                    )
+                    if rel_path_str is None:
+                        continue
                     files_searched += 1
-            if files_visited > 0 and files_visited % 20 == 0 and not await self._yield_and_check_auth():
-                return None
+                    running.add(
+                        asyncio.create_task(
+                            bounded_search(
+                                file_path, root_path, filename, normalized_pattern,
+                                search_text, files_searched, search_mode,
+                                rel_path_str=rel_path_str,
+                            )
+                        )
+                    )
+                    # Let the search start now so its matches stream during the walk.
+                    await asyncio.sleep(0)
+                    if len(running) >= _SEARCH_FILE_WINDOW:
+                        matches += await self._collect_searches(
+                            running, asyncio.FIRST_COMPLETED
+                        )
+                if files_visited > 0 and files_visited % 20 == 0 and not await self._yield_and_check_auth():
+                    return None
+            matches += await self._collect_searches(running, asyncio.ALL_COMPLETED)
+        finally:
+            # Searches still running when the walk stops (cancelled, auth lost, error).
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
         return matches, files_searched
 
     async def _yield_and_check_auth(self) -> bool:
@@ -821,7 +895,7 @@ class SuperSearchWebSocketHandler(
         """Send search_complete or no_files message."""
         if matches == 0:
             self.write_message(
-                json.dumps(
+                _json_dumps(
                     {
                         "type": "no_files",
                         "message": f"No matches found in {files_searched} files.",
@@ -831,7 +905,7 @@ class SuperSearchWebSocketHandler(
             )
         else:
             self.write_message(
-                json.dumps(
+                _json_dumps(
                     {
                         "type": "search_complete",
                         "matches": matches,
@@ -858,7 +932,7 @@ class SuperSearchWebSocketHandler(
         try:
             # Send search start notification
             self.write_message(
-                json.dumps(
+                _json_dumps(
                     {
                         "type": "search_start",
                         "pattern": pattern,
@@ -881,7 +955,7 @@ class SuperSearchWebSocketHandler(
 
         except asyncio.CancelledError:
             try:
-                self.write_message(json.dumps({"type": "cancelled"}))
+                self.write_message(_json_dumps({"type": "cancelled"}))
             except (tornado.websocket.WebSocketClosedError, RuntimeError):
                 pass
             raise
@@ -889,7 +963,7 @@ class SuperSearchWebSocketHandler(
             logging.exception("Super search error")
             try:
                 self.write_message(
-                    json.dumps({"type": "error", "message": f"Search failed: {str(e)}"})
+                    _json_dumps({"type": "error", "message": f"Search failed: {str(e)}"})
                 )
             except (tornado.websocket.WebSocketClosedError, RuntimeError):
                 pass
@@ -905,11 +979,37 @@ class SuperSearchWebSocketHandler(
             "search_text": search_text,
         }
         try:
-            self.write_message(json.dumps(message))
+            self.write_message(_json_dumps(message))
+        except (tornado.websocket.WebSocketClosedError, RuntimeError):
+            pass
+
+    def send_match_batch(
+        self, file_path: str, matches: list[tuple[int, str]], search_text: str
+    ):
+        """Send (line_number, line_content) matches from one file as a single frame."""
+        if not matches:
+            return
+        if len(matches) == 1:
+            self.send_match(file_path, matches[0][0], matches[0][1], search_text)
+            return
+        message = {
+            "type": "match_batch",
+            "file_path": file_path,
+            "search_text": search_text,
+            "matches": [
+                {"line_number": line_number, "line_content": line_content}
+                for line_number, line_content in matches
+            ],
+        }
+        try:
+            self.write_message(_json_dumps(message))
         except (tornado.websocket.WebSocketClosedError, RuntimeError):
             pass
 
     def on_close(self):
+        self._pending_search = None
+        if self._cancel_task is not None:
+            self._cancel_task.cancel()
         if self.search_task:
             self.stop_event.set()
         super().on_close()
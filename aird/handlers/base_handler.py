@@ -505,6 +505,20 @@ def _display_username_from_legacy(user, handler):
     return user_str
 
 
+# Static response headers, shared by every request (see set_default_headers).
+_DEFAULT_SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    ("Permissions-Policy", "camera=(), microphone=(), geolocation=(), payment=()"),
+    # SharedArrayBuffer / Wasm workers (cross-origin isolated context)
+    ("Cross-Origin-Opener-Policy", "same-origin"),
+    ("Cross-Origin-Embedder-Policy", "credentialless"),
+    ("Cross-Origin-Resource-Policy", "same-origin"),
+)
+_HSTS_HEADER = ("Strict-Transport-Security", "max-age=31536000; includeSubDomains")
+
+
 class BaseHandler(tornado.web.RequestHandler):
     _TOKEN_ONLY_USERNAMES = {"token_user", "admin_token"}
 
@@ -904,23 +918,10 @@ class BaseHandler(tornado.web.RequestHandler):
         return self._csp_nonce
 
     def set_default_headers(self):
-        # Security headers
-        self.set_header("X-Content-Type-Options", "nosniff")
-        self.set_header("X-Frame-Options", "DENY")
-        self.set_header("Referrer-Policy", "strict-origin-when-cross-origin")
-        self.set_header(
-            "Permissions-Policy",
-            "camera=(), microphone=(), geolocation=(), payment=()",
-        )
-        # SharedArrayBuffer / Wasm workers (cross-origin isolated context)
-        self.set_header("Cross-Origin-Opener-Policy", "same-origin")
-        self.set_header("Cross-Origin-Embedder-Policy", "credentialless")
-        self.set_header("Cross-Origin-Resource-Policy", "same-origin")
+        for name, value in _DEFAULT_SECURITY_HEADERS:
+            self.set_header(name, value)
         if getattr(self.request, "protocol", None) == "https":
-            self.set_header(
-                "Strict-Transport-Security",
-                "max-age=31536000; includeSubDomains",
-            )
+            self.set_header(*_HSTS_HEADER)
         # Note: CSP with nonce is set in render() after nonce generation
 
     def _set_csp_header(self):
@@ -22,7 +22,7 @@ from aird.handlers.base_handler import (
 )
 from aird.core.mmap_handler import MMapFileHandler
 from aird.core.zip_download import ZipDownloadError, build_zip_file, collect_zip_entries
-from aird.utils.util import sanitize_cloud_filename, is_feature_enabled, get_file_size_safe
+from aird.utils.util import sanitize_cloud_filename, is_feature_enabled, get_file_size_safe, _json_loads
 from aird.constants.input_limits import (
     EDIT_JSON_BODY_MAX_BYTES,
     MAX_BULK_JSON_BYTES,
@@ -184,6 +184,24 @@ def finalize_upload_to_disk(
     return (True, 200, UPLOAD_SUCCESSFUL)
 
 
+# Upper bound on one coalesced upload write, so a backlog is never joined whole.
+_UPLOAD_WRITE_BATCH_BYTES = 4 * 1024 * 1024
+
+
+def _take_write_batch(buffer, max_bytes: int = _UPLOAD_WRITE_BATCH_BYTES) -> bytes:
+    """Pop queued chunks from the left of ``buffer`` up to ``max_bytes`` and join them.
+
+    Always takes at least one chunk, so a single oversized chunk is written as is.
+    """
+    parts = [buffer.popleft()]
+    size = len(parts[0])
+    while buffer and size + len(buffer[0]) <= max_bytes:
+        chunk = buffer.popleft()
+        parts.append(chunk)
+        size += len(chunk)
+    return parts[0] if len(parts) == 1 else b"".join(parts)
+
+
 def _query_arg(query_args: dict, name: str) -> str | None:
     """First value for a Tornado query argument name."""
     if not query_args:
@@ -432,8 +450,8 @@ class UploadHandler(BaseHandler):
             return
 
         fd, self._temp_path = tempfile.mkstemp(prefix="aird_upload_")
-        os.close(fd)
-        self._aiofile = await aiofiles.open(self._temp_path, "wb")
+        # Wrap mkstemp's descriptor instead of closing and reopening the path.
+        self._aiofile = await aiofiles.open(fd, "wb")
 
     def data_received(self, chunk: bytes) -> None:
         if self._reject:
@@ -461,8 +479,9 @@ class UploadHandler(BaseHandler):
     async def _drain_buffer(self) -> None:
         try:
             while self._buffer:
-                data = self._buffer.popleft()
-                await self._aiofile.write(data)
+                # Coalesce chunks queued during the previous write: one
+                # thread-pool hop per drain pass instead of one per chunk.
+                await self._aiofile.write(_take_write_batch(self._buffer))
         finally:
             self._writing = False
 
@@ -987,7 +1006,7 @@ class EditHandler(BaseHandler):
         content_type = self.request.headers.get("Content-Type", "")
         if content_type.startswith(HEADER_APPLICATION_JSON):
             try:
-                data = json.loads(self.request.body.decode("utf-8", errors="replace") or "{}")
+                data = _json_loads(self.request.body.decode("utf-8", errors="replace") or "{}")
                 return data.get("path", ""), data.get("content", "")
             except Exception:
                 self.set_status(400)
@@ -38,19 +38,35 @@ class HealthHandler(tornado.web.RequestHandler):
         self.write(status)
 
 
+_SW_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "static", "js", "sw-transfer.js"
+)
+_SW_HEADERS = (
+    ("Content-Type", "application/javascript; charset=utf-8"),
+    ("Service-Worker-Allowed", "/"),
+    ("Cache-Control", "no-store, must-revalidate"),
+    ("Pragma", "no-cache"),
+)
+# (mtime_ns, body) — re-read only when the file on disk changes.
+_sw_body_cache: tuple[int, bytes] | None = None
+
+
+def _service_worker_body() -> bytes:
+    global _sw_body_cache
+    mtime_ns = os.stat(_SW_PATH).st_mtime_ns
+    cached = _sw_body_cache
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(_SW_PATH, "rb") as fh:
+        body = fh.read()
+    _sw_body_cache = (mtime_ns, body)
+    return body
+
+
 class ServiceWorkerHandler(tornado.web.RequestHandler):
     """Serve the transfer service worker from site root (scope /)."""
 
     def get(self):
-        sw_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "static",
-            "js",
-            "sw-transfer.js",
-        )
-        self.set_header("Content-Type", "application/javascript; charset=utf-8")
-        self.set_header("Service-Worker-Allowed", "/")
-        self.set_header("Cache-Control", "no-store, must-revalidate")
-        self.set_header("Pragma", "no-cache")
-        with open(sw_path, "rb") as fh:
-            self.write(fh.read())
+        for name, value in _SW_HEADERS:
+            self.set_header(name, value)
+        self.write(_service_worker_body())
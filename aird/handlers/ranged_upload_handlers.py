@@ -46,7 +46,11 @@ from aird.handlers.base_handler import (
     require_modify_access,
 )
 from aird.handlers.constants import DB_UNAVAILABLE_SHORT
-from aird.handlers.file_op_handlers import finalize_upload_to_disk, _query_arg
+from aird.handlers.file_op_handlers import (
+    finalize_upload_to_disk,
+    _query_arg,
+    _take_write_batch,
+)
 from aird.utils.util import is_feature_enabled
 from aird.core.rate_limit import TransferRateLimiter
 
@@ -416,8 +420,8 @@ class RangedUploadChunkHandler(BaseHandler):
                 )
             self._chunk_slot_user = username
         fd, self._request_temp_path = tempfile.mkstemp(prefix="aird_range_request_")
-        os.close(fd)
-        self._request_file = await aiofiles.open(self._request_temp_path, "wb")
+        # Wrap mkstemp's descriptor instead of closing and reopening the path.
+        self._request_file = await aiofiles.open(fd, "wb")
 
     def data_received(self, chunk: bytes) -> None:
         if self._request_write_error is not None:
@@ -433,7 +437,7 @@ class RangedUploadChunkHandler(BaseHandler):
     async def _drain_request_buffer(self) -> None:
         try:
             while self._request_buffer:
-                await self._request_file.write(self._request_buffer.popleft())
+                await self._request_file.write(_take_write_batch(self._request_buffer))
         except OSError as exc:
             self._request_write_error = exc
             logger.warning("Ranged upload request staging write failed: %s", exc)
@@ -97,6 +97,37 @@ def _ws_check_access(handler, action: str, resource_path: str | None = None) ->
         return False
 
 
+class _WsUpload:
+    """State for the one in-flight upload on a transfer socket."""
+
+    __slots__ = (
+        "upload_dir",
+        "filename",
+        "total_size",
+        "compressed",
+        "bytes_received",
+        "temp_path",
+        "aiofile",
+    )
+
+    def __init__(
+        self,
+        upload_dir: str,
+        filename: str,
+        total_size: int,
+        compressed: bool,
+        temp_path: str,
+        aiofile,
+    ) -> None:
+        self.upload_dir = upload_dir
+        self.filename = filename
+        self.total_size = total_size
+        self.compressed = compressed
+        self.bytes_received = 0
+        self.temp_path = temp_path
+        self.aiofile = aiofile
+
+
 class FileTransferWebSocketHandler(
     ManagedWebSocketMixin, tornado.websocket.WebSocketHandler
 ):
@@ -113,7 +144,7 @@ class FileTransferWebSocketHandler(
 
     def __init__(self, application, request, **kwargs):
         super().__init__(application, request, **kwargs)
-        self._upload: dict | None = None
+        self._upload: _WsUpload | None = None
         self._upload_buffer: deque[bytes] = deque()
         self._upload_buffer_event = asyncio.Event()
         self._upload_writer_done = False
@@ -201,17 +232,11 @@ class FileTransferWebSocketHandler(
             return
 
         fd, temp_path = tempfile.mkstemp(prefix="aird_ws_upload_")
-        os.close(fd)
-        aiofile = await aiofiles.open(temp_path, "wb")
-        self._upload = {
-            "upload_dir": upload_dir,
-            "filename": filename,
-            "total_size": total_size,
-            "compressed": compressed,
-            "bytes_received": 0,
-            "temp_path": temp_path,
-            "aiofile": aiofile,
-        }
+        # Wrap mkstemp's descriptor instead of closing and reopening the path.
+        aiofile = await aiofiles.open(fd, "wb")
+        self._upload = _WsUpload(
+            upload_dir, filename, total_size, compressed, temp_path, aiofile
+        )
         self._upload_writer_done = False
         self._upload_buffer_event.clear()
         self._upload_writer_task = asyncio.create_task(self._upload_writer_loop())
@@ -222,15 +247,16 @@ class FileTransferWebSocketHandler(
             await self._send_json({"type": "error", "message": "No upload in progress"})
             return
 
-        if self._upload.get("compressed"):
+        upload = self._upload
+        if upload.compressed:
             try:
                 data = zlib.decompress(data)
             except Exception as exc:
                 await self._abort_upload(f"Decompression failed: {exc}")
                 return
 
-        self._upload["bytes_received"] += len(data)
-        if self._upload["bytes_received"] > self._upload["total_size"]:
+        upload.bytes_received += len(data)
+        if upload.bytes_received > upload.total_size:
             await self._abort_upload("Upload exceeds declared size")
             return
 
@@ -245,9 +271,9 @@ class FileTransferWebSocketHandler(
                 self._upload_buffer_event.clear()
                 while self._upload_buffer and self._upload:
                     chunk = self._upload_buffer.popleft()
-                    await self._upload["aiofile"].write(chunk)
+                    await self._upload.aiofile.write(chunk)
                 if self._upload:
-                    await self._upload["aiofile"].flush()
+                    await self._upload.aiofile.flush()
                 if self._upload_writer_done:
                     return
         except asyncio.CancelledError:
@@ -264,12 +290,12 @@ class FileTransferWebSocketHandler(
             except Exception:
                 logger.debug("WS upload writer await failed", exc_info=True)
             self._upload_writer_task = None
-        if self._upload and self._upload.get("aiofile"):
+        if self._upload and self._upload.aiofile:
             try:
-                await self._upload["aiofile"].close()
+                await self._upload.aiofile.close()
             except Exception:
                 logger.debug("WS upload file close failed", exc_info=True)
-            self._upload["aiofile"] = None
+            self._upload.aiofile = None
 
     async def _abort_upload(self, message: str | None = None) -> None:
         upload = self._upload
@@ -277,7 +303,7 @@ class FileTransferWebSocketHandler(
         self._upload_buffer.clear()
         await self._finalize_upload_writer()
         if upload:
-            path = upload.get("temp_path")
+            path = upload.temp_path
             if path and os.path.isfile(path):
                 try:
                     os.remove(path)
@@ -295,11 +321,11 @@ class FileTransferWebSocketHandler(
         upload = self._upload
         self._upload = None
 
-        received = upload["bytes_received"]
-        expected = upload["total_size"]
+        received = upload.bytes_received
+        expected = upload.total_size
         if received != expected:
             try:
-                os.remove(upload["temp_path"])
+                os.remove(upload.temp_path)
             except OSError:
                 pass
             await self._send_json(
@@ -314,9 +340,9 @@ class FileTransferWebSocketHandler(
         user_root = get_user_root(self)
         success, status, message = await asyncio.to_thread(
             finalize_upload_to_disk,
-            upload_dir=upload["upload_dir"],
-            filename=upload["filename"],
-            temp_path=upload["temp_path"],
+            upload_dir=upload.upload_dir,
+            filename=upload.filename,
+            temp_path=upload.temp_path,
             user_root=user_root,
             username=_ws_display_username(self),
             db_conn=_ws_db_conn(self),
@@ -3,7 +3,6 @@ import os
 import mimetypes
 import asyncio
 import aiofiles
-import concurrent.futures
 import mmap
 import logging
 
@@ -38,7 +37,6 @@ import aird.constants as constants_module
 from aird.handlers.constants import (
     APPLICATION_OCTET_STREAM,
 )
-from aird.constants import CHUNK_SIZE
 from aird.cloud import CloudManager
 from aird.constants.file_ops import PROVIDER_NOT_CONFIGURED
 from aird.core.file_operations import get_files_by_tag_patterns, get_tags_for_path
@@ -149,8 +147,10 @@ async def _serve_download_compressed(handler, abspath, encoding, user_key):
     await TransferRateLimiter.wait_for_bytes(
         user_key, len(compressed), direction="download"
     )
+    # One buffered write: finish() sends headers and body together with a
+    # real Content-Length instead of chunked framing after an early flush.
+    handler.set_header("Content-Length", str(len(compressed)))
     handler.write(compressed)
-    await handler.flush()
 
 
 async def _serve_download_full(handler, abspath, file_size, user_key):
@@ -219,20 +219,25 @@ async def _serve_raw_mode(handler, abspath):
             # Default DENY blocks <iframe>/<embed> in media_view.html on same host.
             handler.set_header("X-Frame-Options", "SAMEORIGIN")
         file_size = os.path.getsize(abspath)
-        if MMapFileHandler.should_use_mmap(file_size):
-            async for chunk in MMapFileHandler.serve_file_chunk(abspath):
-                handler.write(chunk)
-                await handler.flush()
-        else:
-            async with aiofiles.open(abspath, "rb") as f:
-                while True:
-                    chunk = await f.read(CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    handler.write(chunk)
-                    await handler.flush()
+        # Known length: no chunked framing, and clients can show progress.
+        handler.set_header("Content-Length", str(file_size))
+        if handler.request.method == "HEAD":
+            return
+        # serve_file_chunk picks aiofiles or mmap by size and holds one chunk.
+        # Stop at the declared length even if the file grows meanwhile.
+        async for chunk in MMapFileHandler.serve_file_chunk(
+            abspath, end=file_size - 1
+        ):
+            handler.write(chunk)
+            await handler.flush()
     except Exception:
         logging.exception("Error serving raw file")
+        if handler._headers_written:
+            # Status and Content-Length are already on the wire; drop the
+            # connection rather than send a short or corrupted body.
+            handler.request.connection.close()
+            return
+        handler.clear_header("Content-Length")
         handler.set_status(500)
         handler.write("Error serving file")
 
@@ -473,10 +478,8 @@ class EditViewHandler(BaseHandler):
                         with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
                             return mm[:].decode("utf-8", errors="replace")
 
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    full_file_content = await asyncio.get_event_loop().run_in_executor(
-                        executor, read_mmap
-                    )
+                # Shared default executor (sized by apply_io_thread_pool).
+                full_file_content = await asyncio.to_thread(read_mmap)
             else:
                 # Use aiofiles for small files
                 async with aiofiles.open(
@@ -661,14 +664,20 @@ class TaggedFilesHandler(BaseHandler):
         )
 
 
+_NO_CACHE_STATIC_HEADERS = (
+    ("Cache-Control", "no-cache, no-store, must-revalidate"),
+    ("Pragma", "no-cache"),
+    ("Expires", "0"),
+    # The document is cross-origin isolated. Dedicated workers must return
+    # compatible isolation/resource headers too, otherwise Chromium blocks
+    # the worker before any upload request is sent.
+    ("Cross-Origin-Embedder-Policy", "credentialless"),
+    ("Cross-Origin-Resource-Policy", "same-origin"),
+    ("X-Content-Type-Options", "nosniff"),
+)
+
+
 class NoCacheStaticFileHandler(tornado.web.StaticFileHandler):
     def set_extra_headers(self, path):
-        self.set_header("Cache-Control", "no-cache, no-store, must-revalidate")
-        self.set_header("Pragma", "no-cache")
-        self.set_header("Expires", "0")
-        # The document is cross-origin isolated. Dedicated workers must return
-        # compatible isolation/resource headers too, otherwise Chromium blocks
-        # the worker before any upload request is sent.
-        self.set_header("Cross-Origin-Embedder-Policy", "credentialless")
-        self.set_header("Cross-Origin-Resource-Policy", "same-origin")
-        self.set_header("X-Content-Type-Options", "nosniff")
+        for name, value in _NO_CACHE_STATIC_HEADERS:
+            self.set_header(name, value)
@@ -224,13 +224,19 @@ def make_app(
     else:
         login_handler = LoginHandler
 
-    # Build routes list
+    # Build routes list. Tornado tries rules in order, so the high-volume
+    # routes (browse/download, ranged-upload chunks) come first; none of them
+    # overlaps a later pattern.
     routes = [
         (
             r"/static/(.*)",
             NoCacheStaticFileHandler,
             {"path": settings["static_path"]},
         ),
+        (r"/files/(.*)", MainHandler),
+        (r"/api/upload/range/session", RangedUploadSessionHandler),
+        (r"/api/upload/range/([^/]+)/status", RangedUploadStatusHandler),
+        (r"/api/upload/range/([^/]+)", RangedUploadChunkHandler),
         (r"/", RootHandler),
         (r"/health", HealthHandler),
         (r"/sw-transfer.js", ServiceWorkerHandler),
@@ -275,9 +281,6 @@ def make_app(
         (r"/runtime-config", RuntimeConfigSocketHandler),
         (r"/api/runtime-config", RuntimeConfigAPIHandler),
         (r"/upload", UploadHandler),
-        (r"/api/upload/range/session", RangedUploadSessionHandler),
-        (r"/api/upload/range/([^/]+)/status", RangedUploadStatusHandler),
-        (r"/api/upload/range/([^/]+)", RangedUploadChunkHandler),
         (r"/mkdir", CreateFolderHandler),
         (r"/delete", DeleteHandler),
         (r"/rename", RenameHandler),
@@ -309,7 +312,6 @@ def make_app(
         (r"/search/ws", SuperSearchWebSocketHandler),
         (r"/p2p", P2PTransferHandler),
         (r"/p2p/signal", P2PSignalingHandler),
-        (r"/files/(.*)", MainHandler),
     ]
 
     # Add LDAP routes only if LDAP is enabled
@@ -375,16 +377,29 @@ def _validate_ssl_config() -> bool:
             "Both --ssl-cert and --ssl-key are required for SSL."
         )
         return False
-    if config.SSL_CERT and config.SSL_KEY:
-        if not os.path.exists(config.SSL_CERT):
-            logger.error(f"SSL certificate file not found: {config.SSL_CERT}")
-            return False
-        if not os.path.exists(config.SSL_KEY):
-            logger.error(f"SSL key file not found: {config.SSL_KEY}")
-            return False
     return True
 
 
+def _load_ssl_context() -> ssl.SSLContext | None:
+    """Build the server TLS context, or return None (logging why) if the
+    certificate/key cannot be loaded.
+
+    Missing files surface from ``load_cert_chain`` itself rather than from a
+    separate ``os.path.exists`` pre-check, which costs extra stats and can race.
+    """
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+    try:
+        ssl_context.load_cert_chain(config.SSL_CERT, config.SSL_KEY)
+    except FileNotFoundError as e:
+        logger.error(f"SSL certificate or key file not found: {e.filename}")
+        return None
+    except (OSError, ssl.SSLError) as e:
+        logger.error(f"Could not load SSL certificate/key: {e}")
+        return None
+    return ssl_context
+
+
 def _open_db_connection(db_path: str):
     """Open SQLite and wrap for free-threaded (nogil) safety."""
     raw = sqlite3.connect(db_path, check_same_thread=False)
@@ -591,6 +606,14 @@ def _build_application():
     )
 
 
+# First probe after 60s idle, then every 10s; drop after 6 misses (~2 min).
+_TCP_KEEPALIVE_TIMINGS = (
+    ("TCP_KEEPIDLE", 60),
+    ("TCP_KEEPINTVL", 10),
+    ("TCP_KEEPCNT", 6),
+)
+
+
 def _tune_sockets(sockets: list) -> None:
     """Apply TCP tuning for high-throughput file transfers."""
     for sock in sockets:
@@ -605,6 +628,16 @@ def _tune_sockets(sockets: list) -> None:
             sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         except OSError:
             pass
+        try:
+            # SO_KEEPALIVE: reap half-open peers on long-lived WebSocket /
+            # streaming connections. Accepted sockets inherit this on Linux.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for opt_name, value in _TCP_KEEPALIVE_TIMINGS:
+                opt = getattr(socket, opt_name, None)
+                if opt is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, opt, value)
+        except OSError:
+            pass
         try:
             # TCP_CORK / TCP_NOPUSH: batch large writes (Linux/macOS).
             _TCP_CORK = getattr(socket, "TCP_CORK", None)
@@ -729,6 +762,11 @@ def main():
         return
     if not _validate_ssl_config():
         return
+    ssl_options = None
+    if config.SSL_CERT and config.SSL_KEY:
+        ssl_options = _load_ssl_context()
+        if ssl_options is None:
+            return
 
     constants.ACCESS_TOKEN = config.ACCESS_TOKEN
     constants.ADMIN_TOKEN = config.ADMIN_TOKEN
@@ -758,13 +796,6 @@ def main():
             ),
         )
 
-    ssl_options = None
-    if config.SSL_CERT and config.SSL_KEY:
-        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
-        ssl_context.load_cert_chain(config.SSL_CERT, config.SSL_KEY)
-        ssl_options = ssl_context
-
     worker_count = resolve_worker_count(config.WORKERS)
     _start_server(ssl_options, config.PORT, config.HOSTNAME, worker_count)
 
@@ -279,6 +279,12 @@ class SuperSearch {
             this.addMatch(data);
             break;
 
+          case 'match_batch':
+            for (const match of data.matches) {
+              this.addMatch({ type: 'match', file_path: data.file_path, search_text: data.search_text, ...match });
+            }
+            break;
+
           case 'search_complete':
             this.showStatus(`Search completed — ${this.totalMatches} matches in ${this.results.size} files.`, 'success');
             this.progressFill.value = 100;
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import json
@@ -21,6 +22,7 @@ from aird.constants.media import (
     EXTENSION_ICONS,
 )
 from aird.db import load_feature_flags, DB_CONN, load_websocket_config
+from aird.db.schema import PRAGMA_TABLE_INFO
 from aird.sql_identifiers import format_select_columns, format_shares_select_sql
 from aird.core.filter_expression import FilterExpression  # noqa: F401
 from aird.core.file_operations import (  # noqa: F401
@@ -39,16 +41,45 @@ from aird.core.file_operations import (  # noqa: F401
 )
 
 
+try:  # orjson is optional; stdlib json is the fallback.
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # orjson rejects lone surrogates, which os.walk uses for
+            # non-UTF-8 filenames; json escapes them instead.
+            return json.dumps(obj)
+
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
 def _parse_json_field(json_str, default):
     """Parse a JSON string, returning default on any error or if falsy."""
     if not json_str:
         return default
     try:
-        return json.loads(json_str)
+        return _json_loads(json_str)
     except (ValueError, TypeError):
         return default
 
 
+def _parse_json_list(json_str, default):
+    """Parse a column written by ``json.dumps(list)``.
+
+    Anything not starting with ``[`` (NULL, ``"null"``, legacy garbage) falls
+    back to *default* without going through the parser and its exceptions.
+    """
+    if not isinstance(json_str, str) or not json_str.startswith("["):
+        return default
+    return _parse_json_field(json_str, default)
+
+
 _SHARE_LOAD_OPTIONAL_COLS = [
     "allowed_users",
     "secret_token",
@@ -57,76 +88,90 @@ _SHARE_LOAD_OPTIONAL_COLS = [
     "avoid_list",
     "expiry_date",
 ]
-_SHARE_LOAD_COLS_ALLOWED = frozenset(
-    ["id", "created", "paths", *_SHARE_LOAD_OPTIONAL_COLS]
+_SHARE_LOAD_COLS = ["id", "created", "paths", *_SHARE_LOAD_OPTIONAL_COLS]
+# Every SELECT expression _load_share_select_exprs may emit: a column or its NULL stand-in.
+_SHARE_LOAD_EXPRS_ALLOWED = frozenset(
+    [*_SHARE_LOAD_COLS, *(f"NULL AS {c}" for c in _SHARE_LOAD_COLS)]
 )
 
 
-def _load_share_col_names(conn: sqlite3.Connection) -> list:
-    """Return the column list to SELECT from shares, based on available schema."""
-    cursor = conn.execute("PRAGMA table_info(shares)")
-    available = {row[1] for row in cursor.fetchall()}
-    return ["id", "created", "paths"] + [
-        c for c in _SHARE_LOAD_OPTIONAL_COLS if c in available
-    ]
-
+def _load_share_select_exprs(conn: sqlite3.Connection) -> str:
+    """Return the SELECT list for shares, with ``NULL AS col`` for missing columns.
 
-def _share_row_to_dict(row: tuple, col_names: list) -> dict:
-    """Convert a raw shares DB row to the canonical share dict."""
-    d = dict(zip(col_names, row))
+    The row shape is always ``_SHARE_LOAD_COLS`` regardless of schema age.
+    Not cached per connection: see ``aird.db.shares._cached_share_col_names``
+    (connections may be migrated in place, and sqlite3 connections cannot be
+    weak-referenced).
+    """
+    cursor = conn.execute(PRAGMA_TABLE_INFO)
+    available = {row[1] for row in cursor.fetchall()}
+    return format_select_columns(
+        [c if c in available else f"NULL AS {c}" for c in _SHARE_LOAD_COLS],
+        _SHARE_LOAD_EXPRS_ALLOWED,
+    )
+
+
+def _share_row_to_dict(row: tuple) -> dict:
+    """Convert a raw shares DB row (``_SHARE_LOAD_COLS`` order) to a share dict."""
+    (
+        _id,
+        created,
+        paths,
+        allowed_users,
+        secret_token,
+        share_type,
+        allow_list,
+        avoid_list,
+        expiry_date,
+    ) = row
     return {
-        "paths": _parse_json_field(d.get("paths"), []),
-        "created": d["created"],
-        "allowed_users": _parse_json_field(d.get("allowed_users"), None),
-        "secret_token": d.get("secret_token"),
-        "share_type": d.get("share_type") or "static",
-        "allow_list": _parse_json_field(d.get("allow_list"), []),
-        "avoid_list": _parse_json_field(d.get("avoid_list"), []),
-        "expiry_date": d.get("expiry_date"),
+        "paths": _parse_json_list(paths, []),
+        "created": created,
+        "allowed_users": _parse_json_list(allowed_users, None),
+        "secret_token": secret_token,
+        "share_type": share_type or "static",
+        "allow_list": _parse_json_list(allow_list, []),
+        "avoid_list": _parse_json_list(avoid_list, []),
+        "expiry_date": expiry_date,
     }
 
 
 def _load_shares(conn: sqlite3.Connection) -> dict:
-    loaded: dict = {}
     try:
-        col_names = _load_share_col_names(conn)
-        cols = format_select_columns(col_names, _SHARE_LOAD_COLS_ALLOWED)
-        rows = conn.execute(format_shares_select_sql(cols)).fetchall()
-        for row in rows:
-            d = dict(zip(col_names, row))
-            loaded[d["id"]] = _share_row_to_dict(row, col_names)
+        select_exprs = _load_share_select_exprs(conn)
+        rows = conn.execute(format_shares_select_sql(select_exprs)).fetchall()
+        return {row[0]: _share_row_to_dict(row) for row in rows}
     except Exception:
         logging.getLogger(__name__).exception("Error loading shares")
         return {}
-    return loaded
 
 
+# Media kinds take precedence over EXTENSION_ICONS, so fold them in last.
+_ICON_BY_EXT: dict[str, str] = {
+    **EXTENSION_ICONS,
+    **dict.fromkeys(VIDEO_EXTENSIONS, "🎬"),
+    **dict.fromkeys(AUDIO_EXTENSIONS, "🎵"),
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def get_file_icon(filename: str) -> str:
     """Return an emoji icon for the given filename.
 
     Resolution order:
     1. Exact filename match (case-insensitive) from SPECIAL_FILENAMES.
     2. Files whose name starts with ``.env`` get a lock icon.
-    3. Video / audio extensions (using the canonical sets).
-    4. Extension lookup via EXTENSION_ICONS.
-    5. Default fallback.
+    3. Extension lookup in ``_ICON_BY_EXT`` (video / audio sets override
+       EXTENSION_ICONS).
+    4. Default fallback.
     """
     lower = filename.lower()
-    # 1. Special filenames
-    if lower in SPECIAL_FILENAMES:
-        return SPECIAL_FILENAMES[lower]
-    # 2. .env* files
+    icon = SPECIAL_FILENAMES.get(lower)
+    if icon is not None:
+        return icon
     if filename.startswith(".env"):
         return "🔐"
-
-    ext = os.path.splitext(filename)[1].lower()
-    # 3. Media types via canonical sets
-    if ext in VIDEO_EXTENSIONS:
-        return "🎬"
-    if ext in AUDIO_EXTENSIONS:
-        return "🎵"
-    # 4. Extension table lookup
-    return EXTENSION_ICONS.get(ext, "📦")
+    return _ICON_BY_EXT.get(os.path.splitext(lower)[1], "📦")
 
 
 def format_size(size: int) -> str:
@@ -281,7 +326,8 @@ class WebSocketConnectionManager:
         """Broadcast message to all connections with optional filtering"""
         with self._cleanup_lock:
             dead_connections = set()
-            for conn in self.connections:
+            # Snapshot: write_message may close a socket and re-enter remove_connection.
+            for conn in tuple(self.connections):
                 try:
                     if filter_func is None or filter_func(conn):
                         if hasattr(conn, "write_message"):
@@ -311,7 +357,8 @@ def _format_child_count(count: int) -> str:
 def get_files_in_directory(path="."):
     files = []
     # Materialize once so we can skip per-dir child counts on large listings.
-    entries = list(os.scandir(path))
+    with os.scandir(path) as it:
+        entries = list(it)
     skip_child_counts = len(entries) > 80
     for entry in entries:
         stat = entry.stat()
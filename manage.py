@@ -1,5 +1,6 @@
 import os
 import sys
+import glob
 import shutil
 import subprocess
 import argparse
@@ -11,20 +12,32 @@ SETUP_FILE = "setup.py"
 SRC_CSS = "src/input.css"
 DIST_CSS = "aird/static/css/app.css"
 
-def run_command(cmd, shell=True):
-    """Utility to run a command and exit on failure."""
+def _resolve_argv(argv):
+    """Resolve argv[0] on PATH (npm/uv/twine are .cmd shims on Windows)."""
+    exe = shutil.which(argv[0])
+    return [exe, *argv[1:]] if exe else list(argv)
+
+
+def run_command(argv):
+    """Run an argv list directly (no shell) and exit on failure."""
     try:
-        subprocess.check_call(cmd, shell=shell)
+        subprocess.check_call(_resolve_argv(argv))
+    except FileNotFoundError:
+        print(f"\nError: Command not found: {argv[0]}")
+        sys.exit(127)
     except subprocess.CalledProcessError as e:
         print(f"\nError: Command failed with exit code {e.returncode}")
         sys.exit(e.returncode)
 
 
-def run_shell_command_checked(cmd, shell=True):
-    """Run a shell command without exiting; True on success."""
+def run_command_checked(argv):
+    """Run an argv list directly (no shell) without exiting; True on success."""
     try:
-        subprocess.check_call(cmd, shell=shell)
+        subprocess.check_call(_resolve_argv(argv))
         return True
+    except FileNotFoundError:
+        print(f"\nError: Command not found: {argv[0]}")
+        return False
     except subprocess.CalledProcessError as e:
         print(f"\nError: Command failed with exit code {e.returncode}")
         return False
@@ -50,8 +63,8 @@ def build_css():
     """Compile Tailwind CSS."""
     if os.path.exists("package.json"):
         print("Building Tailwind CSS...")
-        run_command("npm install")
-        run_command("npm run css:build")
+        run_command(["npm", "install"])
+        run_command(["npm", "run", "css:build"])
     else:
         print("Warning: package.json not found, skipping CSS build.")
 
@@ -60,8 +73,8 @@ def build_js():
     """Bundle share UI (esbuild output is not committed; see .gitignore)."""
     if os.path.exists("package.json"):
         print("Building share JS bundle...")
-        run_command("npm install")
-        run_command("npm run js:share")
+        run_command(["npm", "install"])
+        run_command(["npm", "run", "js:share"])
     else:
         print("Warning: package.json not found, skipping JS bundle.")
 
@@ -71,16 +84,18 @@ def build():
     clean()
     build_css()
     build_js()
-    if run_shell_command_checked("uv build"):
+    if run_command_checked(["uv", "build"]):
         return
     if (
-        run_shell_command_checked(f"{sys.executable} -m pip install build")
-        and run_shell_command_checked(f"{sys.executable} -m build")
+        run_command_checked([sys.executable, "-m", "pip", "install", "build"])
+        and run_command_checked([sys.executable, "-m", "build"])
     ):
         return
-    if not run_shell_command_checked(f"{sys.executable} -m pip install setuptools wheel"):
+    if not run_command_checked(
+        [sys.executable, "-m", "pip", "install", "setuptools", "wheel"]
+    ):
         sys.exit(1)
-    run_command(f"{sys.executable} {SETUP_FILE} sdist bdist_wheel")
+    run_command([sys.executable, SETUP_FILE, "sdist", "bdist_wheel"])
 
 def install():
     """Build and install the package binaries."""
@@ -91,11 +106,12 @@ def install():
     if not wheels:
         print("Error: No wheel found in dist/ after build.")
         sys.exit(1)
-    if run_shell_command_checked(f"uv pip install dist/{wheels[0]} --force-reinstall"):
+    wheel = os.path.join("dist", wheels[0])
+    if run_command_checked(["uv", "pip", "install", wheel, "--force-reinstall"]):
         return
-    run_command(f"{sys.executable} -m pip install dist/{wheels[0]} --force-reinstall")
+    run_command([sys.executable, "-m", "pip", "install", wheel, "--force-reinstall"])
 
-def test(verbose=False, quick=False):
+def test(verbose=False, quick=False, markers=None, failfast=False, fast=False):
     """Run tests using pytest."""
     cmd = [sys.executable, "-m", "pytest", "tests/", "-n", "auto"]
     if quick:
@@ -104,12 +120,20 @@ def test(verbose=False, quick=False):
         cmd.append("-v")
     else:
         cmd.append("-q")
-    run_command(" ".join(cmd))
+    if fast:
+        # Inner dev loop: skip wheel builds and other slow/integration tests.
+        fast_expr = "not slow and not integration"
+        markers = f"({markers}) and {fast_expr}" if markers else fast_expr
+    if markers:
+        cmd.extend(["-m", markers])
+    if failfast:
+        cmd.append("-x")
+    run_command(cmd)
 
 def lint():
     """Run linting tests."""
     if os.path.exists("run_tests.py"):
-        run_command(f"{sys.executable} run_tests.py --lint")
+        run_command([sys.executable, "run_tests.py", "--lint"])
     else:
         print("Error: run_tests.py not found.")
 
@@ -179,7 +203,7 @@ def _upload_dist(version, prerelease=False):
         print("  # or: uv pip install " + f'"aird>={version}"')
     confirm = input("Type 'yes' to proceed with twine upload: ")
     if confirm.lower() == "yes":
-        run_command("twine upload dist/*")
+        run_command(["twine", "upload", *sorted(glob.glob("dist/*"))])
     else:
         print("Upload cancelled.")
 
@@ -209,6 +233,15 @@ def main():
     test_parser = subparsers.add_parser("test", help="Run tests")
     test_parser.add_argument("--verbose", action="store_true", help="Verbose output")
     test_parser.add_argument("--quick", action="store_true", help="Quick run")
+    test_parser.add_argument(
+        "-m", "--markers", help='Marker expression passed to pytest -m (e.g. "not slow")'
+    )
+    test_parser.add_argument(
+        "-x", "--failfast", action="store_true", help="Stop on first failure"
+    )
+    test_parser.add_argument(
+        "--fast", action="store_true", help="Skip tests marked slow or integration"
+    )
 
     release_parser = subparsers.add_parser("release", help="Bump version and publish stable")
     release_parser.add_argument("--patch", action="store_const", const="patch", dest="part", default="patch")
@@ -231,7 +264,13 @@ def main():
     elif args.command == "lint":
         lint()
     elif args.command == "test":
-        test(verbose=args.verbose, quick=args.quick)
+        test(
+            verbose=args.verbose,
+            quick=args.quick,
+            markers=args.markers,
+            failfast=args.failfast,
+            fast=args.fast,
+        )
     elif args.command == "release":
         release(args.part)
     elif args.command == "release-dev":
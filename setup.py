@@ -14,6 +14,7 @@ install_requires = [
 
 extras_require = {
     "compress": ["zstandard>=0.22.0"],
+    "fastjson": ["orjson>=3.9.0"],
 }
 
 setup(
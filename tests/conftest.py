@@ -3,20 +3,17 @@ Pytest configuration and shared fixtures for aird tests.
 """
 
 import asyncio
+import functools
 
 import pytest
-import tempfile
-import shutil
 import sqlite3
 from unittest.mock import patch, MagicMock
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing"""
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path):
+    """Temporary directory for testing (pytest prunes old tmp_path trees)."""
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -27,41 +24,77 @@ def test_db():
     conn.close()
 
 
+@pytest.fixture(scope="session")
+def _schema_template():
+    """In-memory database with the full schema, built once per session."""
+    from aird.db import init_db
+
+    conn = sqlite3.connect(":memory:")
+    init_db(conn)
+    yield conn
+    conn.close()
+
+
 @pytest.fixture
-def mock_db_conn():
-    """Mock database connection with initialized tables"""
+def schema_db(_schema_template):
+    """Fresh in-memory database cloned from the session schema template.
+
+    ``backup()`` copies pages, so each test gets the same tables and seed rows
+    as ``init_db`` without re-running the DDL.
+    """
     conn = sqlite3.connect(":memory:")
+    _schema_template.backup(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _low_cost_argon2():
+    """Swap the production Argon2 hasher for minimum-cost parameters.
+
+    Argon2 hashes embed their own parameters, so verification is unaffected;
+    tests only need the scheme, not its ~0.5 s, 64 MiB key derivation.
+    """
     try:
-        from aird.db import init_db
+        from argon2 import PasswordHasher
 
-        init_db(conn)
+        import aird.db.users as users_module
     except ImportError:
-        # Create basic tables if aird.db can't be imported
-        conn.execute("""CREATE TABLE IF NOT EXISTS feature_flags 
-                        (key TEXT PRIMARY KEY, value INTEGER)""")
-        conn.execute("""CREATE TABLE IF NOT EXISTS shares 
-                        (id TEXT PRIMARY KEY, created TEXT, paths TEXT)""")
-        conn.execute("""CREATE TABLE IF NOT EXISTS users 
-                        (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE, 
-                         password_hash TEXT, role TEXT, active INTEGER DEFAULT 1, 
-                         created_at TEXT, last_login TEXT)""")
-        conn.execute("""CREATE TABLE IF NOT EXISTS websocket_config 
-                        (key TEXT PRIMARY KEY, value TEXT)""")
-        conn.commit()
+        yield
+        return
+    original = users_module.PH
+    if original is not None:
+        users_module.PH = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+    yield
+    users_module.PH = original
+
+
+@pytest.fixture(scope="session")
+def argon2_hash():
+    """``hash_password("secure_password")``, computed once per session."""
+    from aird.db.users import hash_password
+
+    return hash_password("secure_password")
+
+
+@pytest.fixture(scope="session")
+def scrypt_hash():
+    """Scrypt-fallback hash of ``"secure_password"``, computed once per session."""
+    from aird.db.users import hash_password
 
+    with patch("aird.db.users.ARGON2_AVAILABLE", False):
+        return hash_password("secure_password")
+
+
+@pytest.fixture
+def mock_db_conn(schema_db):
+    """Mock database connection with initialized tables"""
+    conn = schema_db
     with patch("aird.constants.DB_CONN", conn), patch(
         "aird.handlers.admin_handlers.constants_module.DB_CONN", conn
     ), patch("aird.handlers.admin_handlers.DB_CONN", conn, create=True):
         yield conn
 
-    conn.close()
-
-
-@pytest.fixture(autouse=True)
-def reset_feature_flags():
-    """Reset feature flags to default state before each test"""
-    pass
-
 
 @pytest.fixture
 def mock_tornado_app():
@@ -115,13 +148,21 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "asyncio: Async tests")
 
 
-@pytest.fixture(autouse=True)
-def reset_login_rate_limit():
-    """Reset the global login rate limit counter before each test."""
+@functools.cache
+def _login_attempts():
+    """Resolve auth_handlers._LOGIN_ATTEMPTS once (lazily: Tornado must be
+    imported after pytest_configure has set up the event loop)."""
     try:
         from aird.handlers.auth_handlers import _LOGIN_ATTEMPTS
-
-        _LOGIN_ATTEMPTS.clear()
     except ImportError:
-        pass
+        return None
+    return _LOGIN_ATTEMPTS
+
+
+@pytest.fixture(autouse=True)
+def reset_login_rate_limit():
+    """Reset the global login rate limit counter before each test."""
+    attempts = _login_attempts()
+    if attempts is not None:
+        attempts.clear()
     yield
@@ -7,7 +7,6 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from aird.db import init_db
 from aird.handlers.abac_handlers import (
     AdminPolicyAPIHandler,
     AdminTagAPIHandler,
@@ -23,13 +22,8 @@ from tests.handler_helpers import _default_services, authenticate, patch_db_conn
 
 
 @pytest.fixture
-def db_conn():
-    import sqlite3
-
-    conn = sqlite3.connect(":memory:")
-    init_db(conn)
-    yield conn
-    conn.close()
+def db_conn(schema_db):
+    return schema_db
 
 
 @pytest.fixture
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import os
 import pathlib
 
 import pytest
@@ -1142,6 +1143,72 @@ class TestSuperSearchWebSocketHandlerExtended:
             )
         assert n == 0
 
+    @pytest.mark.asyncio
+    async def test_search_file_content_lines_across_read_blocks(self, tmp_path):
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        handler.send_match = MagicMock()
+        fp = tmp_path / "big.txt"
+        # Line 2 straddles the first read block; line 3 has no trailing newline.
+        fp.write_text("x" * (64 * 1024 - 4) + "\nab needle cd\nlast needle")
+        n = await handler._search_file_content(pathlib.Path(fp), "big.txt", "needle")
+        assert n == 2
+        assert [c.args[1:3] for c in handler.send_match.call_args_list] == [
+            (2, "ab needle cd"),
+            (3, "last needle"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_file_content_batches_matches(self, tmp_path):
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        handler.write_message = MagicMock()
+        fp = tmp_path / "many.txt"
+        fp.write_text("a needle\nno\nb needle\nc needle\n")
+        n = await handler._search_file_content(pathlib.Path(fp), "many.txt", "needle")
+        assert n == 3
+        handler.write_message.assert_called_once()
+        data = json.loads(handler.write_message.call_args[0][0])
+        assert data["type"] == "match_batch"
+        assert data["file_path"] == "many.txt"
+        assert data["matches"] == [
+            {"line_number": 1, "line_content": "a needle"},
+            {"line_number": 3, "line_content": "b needle"},
+            {"line_number": 4, "line_content": "c needle"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_file_content_mmap_prefilter(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("aird.core.mmap_handler.MMAP_MIN_SIZE", 16)
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        handler.send_match = MagicMock()
+        fp = tmp_path / "large.txt"
+        fp.write_text("plain line\n" * 10 + "has needle\n")
+        with patch("aird.handlers.api_handlers.aiofiles.open") as mock_open:
+            n = await handler._search_file_content(
+                pathlib.Path(fp), "large.txt", "absent"
+            )
+        assert n == 0
+        mock_open.assert_not_called()
+        n = await handler._search_file_content(pathlib.Path(fp), "large.txt", "needle")
+        assert n == 1
+        handler.send_match.assert_called_once_with("large.txt", 11, "has needle", "needle")
+
+    @pytest.mark.parametrize("mmap_min_size", [16, 1 << 30], ids=["mmap", "plain"])
+    @pytest.mark.asyncio
+    async def test_search_file_content_invalid_bytes_same_for_any_size(
+        self, tmp_path, monkeypatch, mmap_min_size
+    ):
+        monkeypatch.setattr("aird.core.mmap_handler.MMAP_MIN_SIZE", mmap_min_size)
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        handler.send_match = MagicMock()
+        fp = tmp_path / "mixed.txt"
+        fp.write_bytes(b"padding line\nnee\xffdle\n")
+        n = await handler._search_file_content(pathlib.Path(fp), "mixed.txt", "needle")
+        assert n == 0
+        fp.write_bytes(b"padding line\nnee\xffdle\nneedle\n")
+        n = await handler._search_file_content(pathlib.Path(fp), "mixed.txt", "needle")
+        assert n == 1
+        handler.send_match.assert_called_once_with("mixed.txt", 3, "needle", "needle")
+
     @pytest.mark.asyncio
     async def test_search_one_file_filename_mode_substring(self, tmp_path):
         handler = make_ws_handler(SuperSearchWebSocketHandler)
@@ -1210,6 +1277,61 @@ class TestSuperSearchWebSocketHandlerExtended:
         )
         assert handler.search_task is not None
 
+    @pytest.mark.asyncio
+    async def test_rapid_requeries_coalesce_into_one_restart(self):
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        handler.get_current_user = MagicMock(return_value={"username": "admin"})
+        gate = asyncio.Event()
+        handler.search_task = asyncio.create_task(gate.wait())
+        handler.perform_search = AsyncMock()
+        for text in ("one", "two", "three"):
+            await handler.on_message(
+                json.dumps({"pattern": "*.py", "search_text": text})
+            )
+        first_cancel = handler._cancel_task
+        assert handler._pending_search == ("*.py", "three", "content")
+        gate.set()
+        await first_cancel
+        assert handler._cancel_task is first_cancel
+        assert handler._pending_search is None
+        await handler.search_task
+        handler.perform_search.assert_awaited_once_with("*.py", "three", "content")
+
+    @pytest.mark.asyncio
+    async def test_requery_while_restart_pending_only_updates_pending(self):
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        handler.get_current_user = MagicMock(return_value={"username": "admin"})
+        handler.perform_search = AsyncMock()
+        handler.search_task = asyncio.create_task(asyncio.sleep(0))
+        await handler.search_task
+        # Old search finished, but the restart task has not resumed yet.
+        handler._pending_search = ("*.py", "old", "content")
+        restart = asyncio.create_task(
+            handler._await_cancellation_and_start_new(handler._pending_search)
+        )
+        handler._cancel_task = restart
+        await handler.on_message(json.dumps({"pattern": "*.py", "search_text": "new"}))
+        assert handler._cancel_task is restart
+        await restart
+        await handler.search_task
+        handler.perform_search.assert_awaited_once_with("*.py", "new", "content")
+
+    @pytest.mark.asyncio
+    async def test_on_close_drops_pending_restart(self):
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        handler.get_current_user = MagicMock(return_value={"username": "admin"})
+        gate = asyncio.Event()
+        handler.search_task = asyncio.create_task(gate.wait())
+        handler.perform_search = AsyncMock()
+        await handler.on_message(json.dumps({"pattern": "*.py", "search_text": "x"}))
+        restart = handler._cancel_task
+        handler.on_close()
+        gate.set()
+        with pytest.raises(asyncio.CancelledError):
+            await restart
+        assert handler._pending_search is None
+        handler.perform_search.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_run_search_walk_returns_none_when_auth_lost(self, tmp_path):
         handler = make_ws_handler(SuperSearchWebSocketHandler)
@@ -1223,6 +1345,70 @@ class TestSuperSearchWebSocketHandlerExtended:
             )
         assert res is None
 
+    @pytest.mark.asyncio
+    async def test_run_search_walk_non_utf8_filename(self, tmp_path):
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        with open(os.path.join(os.fsencode(tmp_path), b"caf\xe9.txt"), "wb") as f:
+            f.write(b"hello\n")
+        res = await handler._run_search_walk(
+            pathlib.Path(tmp_path).resolve(), "*.txt", "hello", "content"
+        )
+        assert res == (1, 1)
+        frames = [json.loads(c[0][0]) for c in handler.write_message.call_args_list]
+        assert {"scanning", "match"} <= {frame["type"] for frame in frames}
+
+    @pytest.mark.asyncio
+    async def test_run_search_walk_streams_matches_before_walk_ends(self, tmp_path):
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        root = pathlib.Path(tmp_path).resolve()
+        sent_before_second_dir = []
+
+        def fake_walk(_root, followlinks=False):
+            yield str(root), [], ["hit.txt"]
+            sent_before_second_dir.extend(
+                json.loads(c[0][0])["type"] for c in handler.write_message.call_args_list
+            )
+            yield str(root / "more"), [], ["other.md"]
+
+        async def fake_content(_file_path, rel_path_str, search_text):
+            handler.send_match(rel_path_str, 1, "hello", search_text)
+            return 1
+
+        with patch("aird.handlers.api_handlers.os.walk", side_effect=fake_walk), \
+                patch.object(handler, "_search_file_content", side_effect=fake_content):
+            res = await handler._run_search_walk(root, "*.txt", "hello", "content")
+        assert res == (1, 1)
+        assert "match" in sent_before_second_dir
+
+    @pytest.mark.asyncio
+    async def test_run_search_walk_searches_files_concurrently(self, tmp_path):
+        handler = make_ws_handler(SuperSearchWebSocketHandler)
+        for i in range(10):
+            (tmp_path / f"f{i}.txt").write_text("hello\nworld\nhello\n")
+        (tmp_path / "skip.md").write_text("hello")
+        running = 0
+        peak = 0
+        real_search = handler._search_file_content
+
+        async def tracked(*args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            try:
+                return await real_search(*args)
+            finally:
+                running -= 1
+
+        with patch("aird.handlers.api_handlers._SEARCH_FILE_CONCURRENCY", 3), \
+                patch("aird.handlers.api_handlers._SEARCH_FILE_WINDOW", 4), \
+                patch.object(handler, "_search_file_content", side_effect=tracked):
+            res = await handler._run_search_walk(
+                pathlib.Path(tmp_path).resolve(), "*.txt", "hello", "content"
+            )
+        assert res == (20, 10)
+        assert 1 < peak <= 3
+
     def test_check_origin_super_search(self):
         handler = make_ws_handler(SuperSearchWebSocketHandler)
         with patch(
@@ -1,11 +1,9 @@
 """Tests for the ABAC PEP wiring in BaseHandler."""
 
-import sqlite3
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from aird.db import init_db
 from aird.db.policies import insert_policy
 from aird.handlers.base_handler import BaseHandler, require_action, require_admin
 from aird.services.policy_service import PolicyService
@@ -14,11 +12,8 @@ from tests.handler_helpers import _default_services
 
 
 @pytest.fixture
-def conn():
-    c = sqlite3.connect(":memory:")
-    init_db(c)
-    yield c
-    c.close()
+def conn(schema_db):
+    return schema_db
 
 
 def _make_handler(conn, services, *, role="user"):
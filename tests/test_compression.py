@@ -27,6 +27,12 @@ def test_negotiate_gzip_only():
     assert negotiate_encoding("gzip") == "gzip"
 
 
+def test_negotiate_honours_q_values_and_case():
+    assert negotiate_encoding("br;q=1.0, GZIP;q=0.5") == "gzip"
+    assert negotiate_encoding("gzip;q=0, deflate") is None
+    assert negotiate_encoding("gzip", enabled=["br"]) is None
+
+
 def test_should_compress_text():
     assert should_compress(
         path="/tmp/log.txt",
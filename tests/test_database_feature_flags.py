@@ -95,6 +95,15 @@ class TestSaveFeatureFlags:
         # Should not raise exception
         save_feature_flags(mock_conn, {"flag1": True})
 
+    def test_save_flags_single_batch(self):
+        """Test that all flags are written with one executemany call"""
+        mock_conn = MagicMock()
+        save_feature_flags(mock_conn, {"flag1": True, "flag2": False})
+
+        mock_conn.executemany.assert_called_once()
+        assert mock_conn.executemany.call_args[0][1] == [("flag1", 1), ("flag2", 0)]
+        mock_conn.execute.assert_not_called()
+
 
 class TestLoadWebsocketConfig:
     """Tests for load_websocket_config function"""
@@ -170,7 +179,7 @@ class TestSaveWebsocketConfig:
     def test_save_config_exception_handled(self):
         """Test that exceptions during save are handled"""
         mock_conn = MagicMock()
-        mock_conn.execute.side_effect = Exception("Database error")
+        mock_conn.executemany.side_effect = Exception("Database error")
 
         # Should not raise exception
         save_websocket_config(mock_conn, {"key1": 100})
@@ -179,51 +188,21 @@ class TestSaveWebsocketConfig:
 class TestIsFeatureEnabled:
     """Tests for is_feature_enabled function"""
 
-    def test_feature_enabled_default_false(self):
-        """Test default value is False"""
-        with patch("aird.utils.util.get_current_feature_flags", return_value={}):
-            result = is_feature_enabled("nonexistent_feature")
-            assert result is False
-
-    def test_feature_enabled_custom_default(self):
-        """Test custom default value"""
-        with patch("aird.utils.util.get_current_feature_flags", return_value={}):
-            result = is_feature_enabled("nonexistent_feature", default=True)
-            assert result is True
-
-    def test_feature_enabled_from_constants(self):
-        """Test reading from FEATURE_FLAGS constant"""
-        with patch(
-            "aird.utils.util.get_current_feature_flags",
-            return_value={"my_feature": True},
-        ):
-            result = is_feature_enabled("my_feature")
-            assert result is True
-
-    def test_feature_enabled_from_database(self):
-        """Test reading from database"""
-        with patch(
-            "aird.utils.util.get_current_feature_flags",
-            return_value={"db_feature": True},
-        ):
-            result = is_feature_enabled("db_feature")
-            assert result is True
-
-    def test_feature_database_overrides_constants(self):
-        """Test that database values override constant values"""
-        with patch(
-            "aird.utils.util.get_current_feature_flags",
-            return_value={"my_feature": False},
-        ):
-            result = is_feature_enabled("my_feature")
-            assert result is False  # Database value (0/False) overrides constant (True)
-
-    def test_feature_enabled_exception_uses_default(self):
-        """Test that exceptions fall back to default"""
-        with patch(
-            "aird.utils.util.get_current_feature_flags",
-            return_value={"my_feature": True},
-        ):
-            result = is_feature_enabled("my_feature")
-            # Should use the value from FEATURE_FLAGS since DB failed
-            assert result is True
+    @pytest.mark.parametrize(
+        "flags, name, kwargs, expected",
+        [
+            pytest.param({}, "nonexistent_feature", {}, False, id="default_false"),
+            pytest.param(
+                {}, "nonexistent_feature", {"default": True}, True, id="custom_default"
+            ),
+            pytest.param({"my_feature": True}, "my_feature", {}, True, id="enabled"),
+            # A stored False wins over a True default.
+            pytest.param(
+                {"my_feature": False}, "my_feature", {"default": True}, False,
+                id="stored_false_overrides_default",
+            ),
+        ],
+    )
+    def test_is_feature_enabled(self, flags, name, kwargs, expected):
+        with patch("aird.utils.util.get_current_feature_flags", return_value=flags):
+            assert is_feature_enabled(name, **kwargs) is expected
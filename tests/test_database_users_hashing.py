@@ -1,15 +1,14 @@
-from unittest.mock import patch
 import hashlib
 import secrets
 
 # Import from the OTHER module this time
-from aird.db.users import hash_password, verify_password, ARGON2_AVAILABLE
+from aird.db.users import verify_password, ARGON2_AVAILABLE
 
 
-def test_argon2_hashing_users_module():
+def test_argon2_hashing_users_module(argon2_hash):
     """Test that Argon2 is used when available (users module)"""
     password = "secure_password"
-    hashed = hash_password(password)
+    hashed = argon2_hash
     if ARGON2_AVAILABLE:
         assert hashed.startswith("$argon2")
     else:
@@ -20,14 +19,12 @@ def test_argon2_hashing_users_module():
     assert not verify_password("wrong_password", hashed)
 
 
-def test_scrypt_fallback_users_module():
+def test_scrypt_fallback_users_module(scrypt_hash):
     """Test Scrypt fallback when Argon2 is not available (users module)"""
-    with patch("aird.db.users.ARGON2_AVAILABLE", False):
-        password = "secure_password"
-        hashed = hash_password(password)
-        assert hashed.startswith("scrypt:")
-        assert verify_password(password, hashed)
-        assert not verify_password("wrong_password", hashed)
+    password = "secure_password"
+    assert scrypt_hash.startswith("scrypt:")
+    assert verify_password(password, scrypt_hash)
+    assert not verify_password("wrong_password", scrypt_hash)
 
 
 def test_legacy_sha256_verification_users_module():
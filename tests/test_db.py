@@ -54,12 +54,9 @@ from aird.database.ldap import (
 
 
 @pytest.fixture
-def db_conn():
-    """Create an in-memory SQLite database for testing"""
-    conn = sqlite3.connect(":memory:")
-    init_db(conn)
-    yield conn
-    conn.close()
+def db_conn(schema_db):
+    """In-memory SQLite database with the schema applied."""
+    return schema_db
 
 
 class TestInitDb:
@@ -11,10 +11,12 @@ from aird.handlers.file_op_handlers import (
     MoveHandler,
     BulkHandler,
     path_to_rel,
+    _take_write_batch,
 )
 from aird.cloud import CloudProviderError
 import json
 import asyncio
+from collections import deque
 
 from tests.handler_helpers import _default_services, authenticate, prepare_handler
 
@@ -429,14 +431,14 @@ class TestUploadHandlerDynamicMaxSize:
         handler._buffer = []
         handler._writing = False
 
-        custom_limit = 10 * 1024 * 1024  # 10 MB
+        custom_limit = 10 * 1024
 
         with patch(
             "aird.handlers.file_op_handlers.constants_module"
         ) as mock_constants, patch("asyncio.create_task"):
             mock_constants.MAX_FILE_SIZE = custom_limit
 
-            small_chunk = b"x" * (5 * 1024 * 1024)
+            small_chunk = b"x" * (5 * 1024)
             handler.data_received(small_chunk)
             assert handler._too_large is False
 
@@ -453,17 +455,17 @@ class TestUploadHandlerDynamicMaxSize:
         handler._buffer = []
         handler._writing = False
 
-        large_limit = 50 * 1024 * 1024  # 50 MB
+        large_limit = 50 * 1024
 
         with patch(
             "aird.handlers.file_op_handlers.constants_module"
         ) as mock_constants, patch("asyncio.create_task"):
             mock_constants.MAX_FILE_SIZE = large_limit
 
-            chunk = b"x" * (20 * 1024 * 1024)
+            chunk = b"x" * (20 * 1024)
             handler.data_received(chunk)
             assert handler._too_large is False
-            assert handler._bytes_received == 20 * 1024 * 1024
+            assert handler._bytes_received == 20 * 1024
 
     @pytest.mark.asyncio
     async def test_too_large_error_shows_configured_limit(self):
@@ -1193,8 +1195,8 @@ class TestCloudUploadHandler:
         handler = prepare_handler(CloudUploadHandler(self.mock_app, self.mock_request))
         authenticate(handler, role="user")
 
-        # Create a large file body
-        large_body = b"x" * (600 * 1024 * 1024)  # 600MB (over 512MB limit)
+        # Body just over a scaled-down limit; the check is a plain len() compare.
+        large_body = b"x" * (600 * 1024)
         handler.request.files = {
             "file": [{"body": large_body, "filename": "large.bin"}]
         }
@@ -1206,7 +1208,7 @@ class TestCloudUploadHandler:
 
         with patch(
             "aird.handlers.file_op_handlers.constants_module.MAX_FILE_SIZE",
-            512 * 1024 * 1024,
+            512 * 1024,
         ), patch.object(handler, "set_status") as mock_set_status, patch.object(
             handler, "write"
         ) as mock_write:
@@ -1365,6 +1367,18 @@ class TestPathToRel:
                 assert path_to_rel("/some/path") == "/some/path"
 
 
+class TestTakeWriteBatch:
+    def test_joins_up_to_limit(self):
+        buffer = deque([b"aa", b"bb", b"cc", b"dd"])
+        assert _take_write_batch(buffer, max_bytes=5) == b"aabb"
+        assert list(buffer) == [b"cc", b"dd"]
+
+    def test_oversized_chunk_taken_alone(self):
+        buffer = deque([b"x" * 10, b"y"])
+        assert _take_write_batch(buffer, max_bytes=4) == b"x" * 10
+        assert list(buffer) == [b"y"]
+
+
 class TestCreateFolderHandler:
     def setup_method(self):
         self.mock_app = MagicMock()
@@ -67,3 +67,11 @@ class TestServiceWorkerHandler:
         assert handler.write.called
         body = handler.write.call_args[0][0]
         assert b"sw-transfer" in body or len(body) > 0
+
+    def test_body_is_cached_until_file_changes(self, mock_app, mock_request):
+        first = prepare_handler(ServiceWorkerHandler(mock_app, mock_request))
+        first.get()
+        with patch("builtins.open", side_effect=AssertionError("re-read")):
+            second = prepare_handler(ServiceWorkerHandler(mock_app, mock_request))
+            second.get()
+        assert second.write.call_args[0][0] == first.write.call_args[0][0]
@@ -3,6 +3,7 @@
 import copy
 import pytest
 import sqlite3
+import ssl
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
@@ -53,9 +54,11 @@ from aird.main import (
     _auto_start_network_shares,
     _create_emergency_db_connection,
     _load_and_merge_configs,
+    _load_ssl_context,
     _print_server_urls,
     _run_cleanup_expired_shares,
     _validate_ldap_config,
+    _tune_sockets,
     _validate_ssl_config,
     make_app,
     print_banner,
@@ -63,12 +66,9 @@ from aird.main import (
 
 
 @pytest.fixture
-def db_conn():
-    """Create an in-memory SQLite database for testing"""
-    conn = sqlite3.connect(":memory:")
-    init_db(conn)
-    yield conn
-    conn.close()
+def db_conn(schema_db):
+    """In-memory SQLite database with the schema applied."""
+    return schema_db
 
 
 class TestGetDataDir:
@@ -771,16 +771,34 @@ class TestMainModuleHelpers:
         ):
             assert _validate_ssl_config() is False
 
-    def test_validate_ssl_files_missing(self):
+    def test_load_ssl_context_files_missing(self, tmp_path):
+        with patch("aird.main.config.SSL_CERT", str(tmp_path / "c.pem")), patch(
+            "aird.main.config.SSL_KEY", str(tmp_path / "k.pem")
+        ):
+            assert _load_ssl_context() is None
+
+    def test_load_ssl_context_invalid_pem(self, tmp_path):
+        cert = tmp_path / "c.pem"
+        key = tmp_path / "k.pem"
+        cert.write_text("not a cert")
+        key.write_text("not a key")
+        with patch("aird.main.config.SSL_CERT", str(cert)), patch(
+            "aird.main.config.SSL_KEY", str(key)
+        ):
+            assert _load_ssl_context() is None
+
+    def test_load_ssl_context_files_present(self):
         with patch("aird.main.config.SSL_CERT", "/c.pem"), patch(
             "aird.main.config.SSL_KEY", "/k.pem"
-        ), patch("aird.main.os.path.exists", return_value=False):
-            assert _validate_ssl_config() is False
+        ), patch("aird.main.ssl.SSLContext.load_cert_chain") as load:
+            ctx = _load_ssl_context()
+        assert isinstance(ctx, ssl.SSLContext)
+        load.assert_called_once_with("/c.pem", "/k.pem")
 
-    def test_validate_ssl_files_present(self):
+    def test_validate_ssl_pair_present(self):
         with patch("aird.main.config.SSL_CERT", "/c.pem"), patch(
             "aird.main.config.SSL_KEY", "/k.pem"
-        ), patch("aird.main.os.path.exists", return_value=True):
+        ):
             assert _validate_ssl_config() is True
 
     def test_validate_ssl_unconfigured(self):
@@ -789,6 +807,18 @@ class TestMainModuleHelpers:
         ):
             assert _validate_ssl_config() is True
 
+    def test_tune_sockets_enables_keepalive(self):
+        import socket
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            _tune_sockets([sock])
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 60
+        finally:
+            sock.close()
+
     def test_print_server_urls_localhost_only(self):
         printed = []
         with patch("builtins.print", printed.append), patch(
@@ -962,6 +992,17 @@ class TestMakeApp:
         routes2 = ai2.call_args[0][0]
         assert LDAPConfigHandler in [spec[1] for spec in routes2]
 
+    def test_hot_routes_are_matched_first(self):
+        settings = {"cookie_secret": "test"}
+        with patch.object(tornado.web.Application, "__init__", return_value=None) as ai:
+            make_app(settings)
+        patterns = [spec[0] for spec in ai.call_args[0][0]]
+        assert patterns.index(r"/files/(.*)") < 3
+        # The literal session route must still shadow the chunk wildcard.
+        assert patterns.index(r"/api/upload/range/session") < patterns.index(
+            r"/api/upload/range/([^/]+)"
+        )
+
     def test_with_ldap(self):
         settings = {
             "cookie_secret": "test",
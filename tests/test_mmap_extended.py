@@ -54,12 +54,13 @@ async def test_serve_file_chunk_empty_tail():
         os.unlink(path)
 
 
-def test_find_line_offsets_large_file():
-    from aird.constants import MMAP_MIN_SIZE
+def test_find_line_offsets_large_file(monkeypatch):
+    # Only the mmap branch matters here, not the production 1 MiB threshold.
+    monkeypatch.setattr("aird.core.mmap_handler.MMAP_MIN_SIZE", 4096)
 
     with tempfile.NamedTemporaryFile(delete=False) as fh:
         fh.write(b"\n")
-        fh.write(b"0" * (MMAP_MIN_SIZE + 10))
+        fh.write(b"0" * (4096 + 10))
         path = fh.name
     try:
         offsets = MMapFileHandler.find_line_offsets(path, max_lines=1)
@@ -77,3 +78,16 @@ def test_search_in_file():
         assert len(hits) >= 1
     finally:
         os.unlink(path)
+
+
+def test_search_in_file_mmap_line_numbers(tmp_path, monkeypatch):
+    monkeypatch.setattr("aird.core.mmap_handler.MMAP_MIN_SIZE", 4096)
+    path = tmp_path / "big.txt"
+    path.write_bytes(b"needle one\n" + b"filler\n" * 1000 + b"two needle\nlast needle")
+    hits = MMapFileHandler.search_in_file(str(path), "needle")
+    assert [(h["line_number"], h["line_content"]) for h in hits] == [
+        (1, "needle one"),
+        (1002, "two needle"),
+        (1003, "last needle"),
+    ]
+    assert MMapFileHandler.search_in_file(str(path), "absent") == []
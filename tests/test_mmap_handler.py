@@ -2,7 +2,6 @@
 
 import pytest
 import os
-import tempfile
 
 from aird.core.mmap_handler import MMapFileHandler
 from aird.utils.util import (
@@ -42,292 +41,251 @@ class TestMMapFileHandlerShouldUseMmap:
 class TestMMapFileHandlerFindLineOffsets:
     """Tests for MMapFileHandler.find_line_offsets"""
 
-    def test_find_offsets_simple_file(self):
+    def test_find_offsets_simple_file(self, tmp_path):
         """Test finding line offsets in a simple file"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write("line1\n")
             f.write("line2\n")
             f.write("line3\n")
-            temp_path = f.name
 
-        try:
-            offsets = MMapFileHandler.find_line_offsets(temp_path)
+        offsets = MMapFileHandler.find_line_offsets(temp_path)
 
-            # Should have offsets for 3 lines
-            assert len(offsets) >= 3
-            assert 0 in offsets  # First line starts at 0
-        finally:
-            os.unlink(temp_path)
+        # Should have offsets for 3 lines
+        assert len(offsets) >= 3
+        assert 0 in offsets  # First line starts at 0
 
-    def test_find_offsets_empty_file(self):
+    def test_find_offsets_empty_file(self, tmp_path):
         """Test finding line offsets in an empty file"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "data.txt")
+        open(temp_path, "w").close()
 
-        try:
-            offsets = MMapFileHandler.find_line_offsets(temp_path)
-            # Empty file should have at least offset 0
-            assert 0 in offsets or len(offsets) == 0
-        finally:
-            os.unlink(temp_path)
+        offsets = MMapFileHandler.find_line_offsets(temp_path)
+        # Empty file should have at least offset 0
+        assert 0 in offsets or len(offsets) == 0
 
-    def test_find_offsets_with_max_lines(self):
+    def test_find_offsets_with_max_lines(self, tmp_path):
         """Test finding line offsets with max_lines limit"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             for i in range(100):
                 f.write(f"line{i}\n")
-            temp_path = f.name
 
-        try:
-            offsets = MMapFileHandler.find_line_offsets(temp_path, max_lines=10)
-            assert len(offsets) <= 10
-        finally:
-            os.unlink(temp_path)
+        offsets = MMapFileHandler.find_line_offsets(temp_path, max_lines=10)
+        assert len(offsets) <= 10
 
-    def test_find_offsets_single_line_no_newline(self):
+    def test_find_offsets_single_line_no_newline(self, tmp_path):
         """Test file with single line and no trailing newline"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write("single line without newline")
-            temp_path = f.name
 
-        try:
-            offsets = MMapFileHandler.find_line_offsets(temp_path)
-            assert 0 in offsets
-        finally:
-            os.unlink(temp_path)
+        offsets = MMapFileHandler.find_line_offsets(temp_path)
+        assert 0 in offsets
 
-    def test_find_offsets_preserves_order(self):
+    def test_find_offsets_preserves_order(self, tmp_path):
         """Test that offsets are in ascending order"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write("line1\n")
             f.write("line2\n")
             f.write("line3\n")
-            temp_path = f.name
 
-        try:
-            offsets = MMapFileHandler.find_line_offsets(temp_path)
+        offsets = MMapFileHandler.find_line_offsets(temp_path)
 
-            # Offsets should be in ascending order
-            for i in range(len(offsets) - 1):
-                assert offsets[i] < offsets[i + 1]
-        finally:
-            os.unlink(temp_path)
+        # Offsets should be in ascending order
+        for i in range(len(offsets) - 1):
+            assert offsets[i] < offsets[i + 1]
 
 
 class TestMMapFileHandlerSearchInFile:
     """Tests for MMapFileHandler.search_in_file"""
 
-    def test_search_basic_match(self):
+    def test_search_basic_match(self, tmp_path):
         """Test basic search functionality"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write("hello world\n")
             f.write("goodbye world\n")
             f.write("hello again\n")
-            temp_path = f.name
 
-        try:
-            results = MMapFileHandler.search_in_file(temp_path, "hello")
+        results = MMapFileHandler.search_in_file(temp_path, "hello")
 
-            assert len(results) == 2
-            assert results[0]["line_number"] == 1
-            assert results[1]["line_number"] == 3
-        finally:
-            os.unlink(temp_path)
+        assert len(results) == 2
+        assert results[0]["line_number"] == 1
+        assert results[1]["line_number"] == 3
 
-    def test_search_no_matches(self):
+    def test_search_no_matches(self, tmp_path):
         """Test search with no matches"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write("hello world\n")
             f.write("goodbye world\n")
-            temp_path = f.name
 
-        try:
-            results = MMapFileHandler.search_in_file(temp_path, "notfound")
-            assert len(results) == 0
-        finally:
-            os.unlink(temp_path)
+        results = MMapFileHandler.search_in_file(temp_path, "notfound")
+        assert len(results) == 0
 
-    def test_search_with_max_results(self):
+    def test_search_with_max_results(self, tmp_path):
         """Test search with max_results limit"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             for i in range(100):
                 f.write(f"test line {i}\n")
-            temp_path = f.name
 
-        try:
-            results = MMapFileHandler.search_in_file(temp_path, "test", max_results=5)
-            assert len(results) == 5
-        finally:
-            os.unlink(temp_path)
+        results = MMapFileHandler.search_in_file(temp_path, "test", max_results=5)
+        assert len(results) == 5
 
-    def test_search_match_positions(self):
+    def test_search_match_positions(self, tmp_path):
         """Test that match positions are correctly reported"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write("hello hello hello\n")
-            temp_path = f.name
 
-        try:
-            results = MMapFileHandler.search_in_file(temp_path, "hello")
+        results = MMapFileHandler.search_in_file(temp_path, "hello")
 
-            assert len(results) == 1
-            assert len(results[0]["match_positions"]) == 3
-            assert 0 in results[0]["match_positions"]  # First match at position 0
-        finally:
-            os.unlink(temp_path)
+        assert len(results) == 1
+        assert len(results[0]["match_positions"]) == 3
+        assert 0 in results[0]["match_positions"]  # First match at position 0
 
-    def test_search_line_content_preserved(self):
+    def test_search_line_content_preserved(self, tmp_path):
         """Test that line content is correctly preserved"""
         content = "The quick brown fox"
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write(content + "\n")
-            temp_path = f.name
 
-        try:
-            results = MMapFileHandler.search_in_file(temp_path, "quick")
+        results = MMapFileHandler.search_in_file(temp_path, "quick")
 
-            assert len(results) == 1
-            assert results[0]["line_content"] == content
-        finally:
-            os.unlink(temp_path)
+        assert len(results) == 1
+        assert results[0]["line_content"] == content
 
-    def test_search_empty_file(self):
+    def test_search_empty_file(self, tmp_path):
         """Test search in empty file"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "data.txt")
+        open(temp_path, "w").close()
 
-        try:
-            results = MMapFileHandler.search_in_file(temp_path, "test")
-            assert len(results) == 0
-        finally:
-            os.unlink(temp_path)
+        results = MMapFileHandler.search_in_file(temp_path, "test")
+        assert len(results) == 0
 
-    def test_search_case_sensitive(self):
+    def test_search_case_sensitive(self, tmp_path):
         """Test that search is case sensitive"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write("Hello World\n")
             f.write("hello world\n")
             f.write("HELLO WORLD\n")
-            temp_path = f.name
 
-        try:
-            results = MMapFileHandler.search_in_file(temp_path, "Hello")
-            assert len(results) == 1
-            assert results[0]["line_number"] == 1
-        finally:
-            os.unlink(temp_path)
+        results = MMapFileHandler.search_in_file(temp_path, "Hello")
+        assert len(results) == 1
+        assert results[0]["line_number"] == 1
 
-    def test_search_unicode_content(self):
+    def test_search_unicode_content(self, tmp_path):
         """Test search with unicode content"""
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".txt", encoding="utf-8"
-        ) as f:
+        temp_path = str(tmp_path / "data.txt")
+        with open(temp_path, "w", encoding="utf-8") as f:
             f.write("Héllo wörld\n")
             f.write("日本語テスト\n")
             f.write("Normal text\n")
-            temp_path = f.name
 
-        try:
-            results = MMapFileHandler.search_in_file(temp_path, "Héllo")
-            assert len(results) == 1
+        results = MMapFileHandler.search_in_file(temp_path, "Héllo")
+        assert len(results) == 1
 
-            results = MMapFileHandler.search_in_file(temp_path, "日本語")
-            assert len(results) == 1
-        finally:
-            os.unlink(temp_path)
+        results = MMapFileHandler.search_in_file(temp_path, "日本語")
+        assert len(results) == 1
 
 
 class TestGetFilesInDirectory:
     """Tests for get_files_in_directory function"""
 
-    def test_get_files_basic(self):
+    def test_get_files_basic(self, tmp_path):
         """Test getting files in a directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test files
-            with open(os.path.join(temp_dir, "file1.txt"), "w") as f:
-                f.write("content1")
-            with open(os.path.join(temp_dir, "file2.txt"), "w") as f:
-                f.write("content2")
+        temp_dir = str(tmp_path)
+        # Create test files
+        with open(os.path.join(temp_dir, "file1.txt"), "w") as f:
+            f.write("content1")
+        with open(os.path.join(temp_dir, "file2.txt"), "w") as f:
+            f.write("content2")
 
-            files = get_files_in_directory(temp_dir)
+        files = get_files_in_directory(temp_dir)
 
-            assert len(files) == 2
-            names = [f["name"] for f in files]
-            assert "file1.txt" in names
-            assert "file2.txt" in names
+        assert len(files) == 2
+        names = [f["name"] for f in files]
+        assert "file1.txt" in names
+        assert "file2.txt" in names
 
-    def test_get_files_includes_directories(self):
+    def test_get_files_includes_directories(self, tmp_path):
         """Test that directories are included in results"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            os.makedirs(os.path.join(temp_dir, "subdir"))
-            with open(os.path.join(temp_dir, "file.txt"), "w") as f:
-                f.write("content")
+        temp_dir = str(tmp_path)
+        os.makedirs(os.path.join(temp_dir, "subdir"))
+        with open(os.path.join(temp_dir, "file.txt"), "w") as f:
+            f.write("content")
 
-            files = get_files_in_directory(temp_dir)
+        files = get_files_in_directory(temp_dir)
 
-            dirs = [f for f in files if f["is_dir"]]
-            assert len(dirs) == 1
-            assert dirs[0]["name"] == "subdir"
+        dirs = [f for f in files if f["is_dir"]]
+        assert len(dirs) == 1
+        assert dirs[0]["name"] == "subdir"
 
-    def test_get_files_metadata(self):
+    def test_get_files_metadata(self, tmp_path):
         """Test that file metadata is included"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with open(os.path.join(temp_dir, "test.txt"), "w") as f:
-                f.write("test content")
+        temp_dir = str(tmp_path)
+        with open(os.path.join(temp_dir, "test.txt"), "w") as f:
+            f.write("test content")
 
-            files = get_files_in_directory(temp_dir)
+        files = get_files_in_directory(temp_dir)
 
-            assert len(files) == 1
-            file_info = files[0]
+        assert len(files) == 1
+        file_info = files[0]
 
-            assert "name" in file_info
-            assert "is_dir" in file_info
-            assert "size_bytes" in file_info
-            assert "size_str" in file_info
-            assert "modified" in file_info
-            assert "modified_timestamp" in file_info
+        assert "name" in file_info
+        assert "is_dir" in file_info
+        assert "size_bytes" in file_info
+        assert "size_str" in file_info
+        assert "modified" in file_info
+        assert "modified_timestamp" in file_info
 
-    def test_get_files_size_formatting(self):
+    def test_get_files_size_formatting(self, tmp_path):
         """Test that file size is correctly formatted"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with open(os.path.join(temp_dir, "test.txt"), "w") as f:
-                f.write("x" * 2048)  # 2KB
+        temp_dir = str(tmp_path)
+        with open(os.path.join(temp_dir, "test.txt"), "w") as f:
+            f.write("x" * 2048)  # 2KB
 
-            files = get_files_in_directory(temp_dir)
+        files = get_files_in_directory(temp_dir)
 
-            file_info = files[0]
-            assert file_info["size_bytes"] == 2048
-            assert "KB" in file_info["size_str"]
+        file_info = files[0]
+        assert file_info["size_bytes"] == 2048
+        assert "KB" in file_info["size_str"]
 
-    def test_get_files_directory_child_count(self):
+    def test_get_files_directory_child_count(self, tmp_path):
         """Test that directories show immediate child count"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            subdir = os.path.join(temp_dir, "subdir")
-            os.makedirs(subdir)
-            with open(os.path.join(subdir, "inner.txt"), "w") as f:
-                f.write("x")
+        temp_dir = str(tmp_path)
+        subdir = os.path.join(temp_dir, "subdir")
+        os.makedirs(subdir)
+        with open(os.path.join(subdir, "inner.txt"), "w") as f:
+            f.write("x")
 
-            files = get_files_in_directory(temp_dir)
+        files = get_files_in_directory(temp_dir)
 
-            dir_info = [f for f in files if f["is_dir"]][0]
-            assert dir_info["child_count"] == 1
-            assert dir_info["size_str"] == "1 item"
+        dir_info = [f for f in files if f["is_dir"]][0]
+        assert dir_info["child_count"] == 1
+        assert dir_info["size_str"] == "1 item"
 
-    def test_get_files_empty_subdirectory_count(self):
+    def test_get_files_empty_subdirectory_count(self, tmp_path):
         """Empty subdirectory reports zero items"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            os.makedirs(os.path.join(temp_dir, "empty"))
+        temp_dir = str(tmp_path)
+        os.makedirs(os.path.join(temp_dir, "empty"))
 
-            files = get_files_in_directory(temp_dir)
+        files = get_files_in_directory(temp_dir)
 
-            dir_info = [f for f in files if f["is_dir"]][0]
-            assert dir_info["child_count"] == 0
-            assert dir_info["size_str"] == "0 items"
+        dir_info = [f for f in files if f["is_dir"]][0]
+        assert dir_info["child_count"] == 0
+        assert dir_info["size_str"] == "0 items"
 
-    def test_get_files_empty_directory(self):
+    def test_get_files_empty_directory(self, tmp_path):
         """Test getting files in empty directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            files = get_files_in_directory(temp_dir)
-            assert len(files) == 0
+        temp_dir = str(tmp_path)
+        files = get_files_in_directory(temp_dir)
+        assert len(files) == 0
 
 
 class TestIsVideoFile:
@@ -434,80 +392,68 @@ class TestMMapFileHandlerServeFileChunk:
     """Tests for MMapFileHandler.serve_file_chunk (async generator)"""
 
     @pytest.mark.asyncio
-    async def test_serve_small_file(self):
+    async def test_serve_small_file(self, tmp_path):
         """Test serving a small file (uses traditional method)"""
         content = b"Hello, World!" * 100
 
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".bin") as f:
+        temp_path = str(tmp_path / "data.bin")
+        with open(temp_path, "wb") as f:
             f.write(content)
-            temp_path = f.name
 
-        try:
-            chunks = []
-            async for chunk in MMapFileHandler.serve_file_chunk(temp_path):
-                chunks.append(chunk)
+        chunks = []
+        async for chunk in MMapFileHandler.serve_file_chunk(temp_path):
+            chunks.append(chunk)
 
-            result = b"".join(chunks)
-            assert result == content
-        finally:
-            os.unlink(temp_path)
+        result = b"".join(chunks)
+        assert result == content
 
     @pytest.mark.asyncio
-    async def test_serve_with_range(self):
+    async def test_serve_with_range(self, tmp_path):
         """Test serving file with start/end range"""
         content = b"0123456789" * 100
 
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".bin") as f:
+        temp_path = str(tmp_path / "data.bin")
+        with open(temp_path, "wb") as f:
             f.write(content)
-            temp_path = f.name
 
-        try:
-            chunks = []
-            async for chunk in MMapFileHandler.serve_file_chunk(
-                temp_path, start=10, end=19
-            ):
-                chunks.append(chunk)
+        chunks = []
+        async for chunk in MMapFileHandler.serve_file_chunk(
+            temp_path, start=10, end=19
+        ):
+            chunks.append(chunk)
 
-            result = b"".join(chunks)
-            assert len(result) == 10
-        finally:
-            os.unlink(temp_path)
+        result = b"".join(chunks)
+        assert len(result) == 10
 
     @pytest.mark.asyncio
-    async def test_serve_large_file_one_chunk_in_memory(self):
+    async def test_serve_large_file_one_chunk_in_memory(self, tmp_path):
         """Mmap path must stream chunks without loading the whole file."""
         chunk_size = 64 * 1024
         content = b"x" * (chunk_size * 3 + 100)
 
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".bin") as f:
+        temp_path = str(tmp_path / "data.bin")
+        with open(temp_path, "wb") as f:
             f.write(content)
-            temp_path = f.name
 
-        try:
-            chunks = []
-            async for chunk in MMapFileHandler.serve_file_chunk(
-                temp_path, chunk_size=chunk_size
-            ):
-                chunks.append(chunk)
-                assert len(chunk) <= chunk_size
+        chunks = []
+        async for chunk in MMapFileHandler.serve_file_chunk(
+            temp_path, chunk_size=chunk_size
+        ):
+            chunks.append(chunk)
+            assert len(chunk) <= chunk_size
 
-            assert b"".join(chunks) == content
-            assert len(chunks) > 1
-        finally:
-            os.unlink(temp_path)
+        assert b"".join(chunks) == content
+        assert len(chunks) > 1
 
     @pytest.mark.asyncio
-    async def test_serve_empty_file(self):
+    async def test_serve_empty_file(self, tmp_path):
         """Test serving an empty file"""
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".bin") as f:
-            temp_path = f.name
-
-        try:
-            chunks = []
-            async for chunk in MMapFileHandler.serve_file_chunk(temp_path):
-                chunks.append(chunk)
-
-            result = b"".join(chunks)
-            assert result == b""
-        finally:
-            os.unlink(temp_path)
+        temp_path = str(tmp_path / "data.bin")
+        open(temp_path, "wb").close()
+
+        chunks = []
+        async for chunk in MMapFileHandler.serve_file_chunk(temp_path):
+            chunks.append(chunk)
+
+        result = b"".join(chunks)
+        assert result == b""
@@ -1,8 +1,6 @@
 """Tests for multi-user mode: sanitize_username_for_folder and get_user_root."""
 
 import os
-import tempfile
-import shutil
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -195,11 +193,9 @@ class TestGetUserRoot:
     """Tests for get_user_root() per-user directory resolution."""
 
     @pytest.fixture
-    def temp_root(self):
+    def temp_root(self, tmp_path):
         """Create a temporary directory to use as ROOT_DIR."""
-        d = tempfile.mkdtemp()
-        yield d
-        shutil.rmtree(d, ignore_errors=True)
+        return str(tmp_path)
 
     def _make_handler(self, username="testuser", role="user"):
         """Create a mock handler with the given user context."""
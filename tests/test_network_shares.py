@@ -39,12 +39,9 @@ except ImportError:
 
 
 @pytest.fixture
-def db():
+def db(schema_db):
     """In-memory SQLite with schema initialised."""
-    conn = sqlite3.connect(":memory:")
-    init_db(conn)
-    yield conn
-    conn.close()
+    return schema_db
 
 
 @pytest.fixture
@@ -1,32 +1,27 @@
-from unittest.mock import patch
 import hashlib
 import secrets
-from aird.db import hash_password, verify_password
 
+import pytest
 
-def test_argon2_hashing():
+from aird.db import verify_password
+
+
+def test_argon2_hashing(argon2_hash):
     """Test that Argon2 is used when available"""
     # Assuming ARGON2_AVAILABLE is True in this environment
     password = "secure_password"
-    hashed = hash_password(password)
-    assert hashed.startswith("$argon2")
-    assert verify_password(password, hashed)
-    assert not verify_password("wrong_password", hashed)
+    assert argon2_hash.startswith("$argon2")
+    assert verify_password(password, argon2_hash)
+    assert not verify_password("wrong_password", argon2_hash)
 
 
-def test_scrypt_fallback():
+def test_scrypt_fallback(scrypt_hash):
     """Test Scrypt fallback when Argon2 is not available"""
-    with patch("aird.db.users.ARGON2_AVAILABLE", False):
-        password = "secure_password"
-        # Force reload or adjust the module variable if needed.
-        # Since we patched the imported name in aird.db (if it was imported that way),
-        # or we patch it where it is used.
-        # However, aird.db imports it. Let's patch 'aird.db.ARGON2_AVAILABLE'.
-
-        hashed = hash_password(password)
-        assert hashed.startswith("scrypt:")
-        assert verify_password(password, hashed)
-        assert not verify_password("wrong_password", hashed)
+    # The fixture hashes with aird.db.users.ARGON2_AVAILABLE patched to False.
+    password = "secure_password"
+    assert scrypt_hash.startswith("scrypt:")
+    assert verify_password(password, scrypt_hash)
+    assert not verify_password("wrong_password", scrypt_hash)
 
 
 def test_legacy_sha256_verification():
@@ -40,7 +35,13 @@ def test_legacy_sha256_verification():
     assert not verify_password("wrong_password", legacy_hash)
 
 
-def test_verify_password_edge_cases():
-    assert not verify_password("pass", None)
-    assert not verify_password("pass", "")
-    assert not verify_password("pass", "invalid:format:too:many:colons")
+@pytest.mark.parametrize(
+    "password_hash",
+    [
+        pytest.param(None, id="none"),
+        pytest.param("", id="empty"),
+        pytest.param("invalid:format:too:many:colons", id="malformed"),
+    ],
+)
+def test_verify_password_edge_cases(password_hash):
+    assert not verify_password("pass", password_hash)
@@ -51,14 +51,11 @@ def _make_request(
 
 
 @pytest.fixture
-def conn():
-    c = sqlite3.connect(":memory:")
-    init_db(c)
+def conn(schema_db):
     # Wipe seeded policies so tests can construct exactly the rules they need.
-    c.execute("DELETE FROM policies")
-    c.commit()
-    yield c
-    c.close()
+    schema_db.execute("DELETE FROM policies")
+    schema_db.commit()
+    return schema_db
 
 
 @pytest.fixture
@@ -35,7 +35,6 @@ from aird.core.share_root import (
     filesystem_root_for_share,
     login_matches_share_creator_field,
 )
-from aird.db import init_db
 from aird.db.audit import get_audit_logs, log_audit
 from aird.db.favorites import get_user_favorites, toggle_favorite
 from aird.db.policies import (
@@ -97,11 +96,8 @@ from tests.handler_helpers import _default_services, authenticate, patch_db_conn
 
 
 @pytest.fixture
-def db_conn():
-    conn = sqlite3.connect(":memory:")
-    init_db(conn)
-    yield conn
-    conn.close()
+def db_conn(schema_db):
+    return schema_db
 
 
 class TestInputValidation:
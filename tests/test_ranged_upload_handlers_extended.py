@@ -10,7 +10,6 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from aird.db import init_db
 from aird.db.ranged_uploads import create_session
 from aird.handlers.ranged_upload_handlers import (
     RangedUploadChunkHandler,
@@ -20,13 +19,8 @@ from tests.handler_helpers import _default_services, authenticate, patch_db_conn
 
 
 @pytest.fixture
-def db_conn():
-    import sqlite3
-
-    conn = sqlite3.connect(":memory:")
-    init_db(conn)
-    yield conn
-    conn.close()
+def db_conn(schema_db):
+    return schema_db
 
 
 def _make_handler(handler_cls, body: bytes = b"", headers=None):
@@ -300,3 +294,19 @@ async def test_chunk_put_disk_full_returns_507(db_conn, temp_dir):
         await handler.put("up-disk")
     handler.set_status.assert_called_with(507)
     assert "disk space" in handler.write.call_args[0][0]["error"].lower()
+
+
+@pytest.mark.asyncio
+async def test_drain_request_buffer_coalesces_queued_chunks():
+    handler = _make_handler(RangedUploadChunkHandler)
+    handler._request_buffer = deque([b"ab", b"cd", b"ef"])
+    handler._request_writing = True
+    handler._request_write_error = None
+    mock_file = AsyncMock()
+    handler._request_file = mock_file
+
+    await handler._drain_request_buffer()
+
+    mock_file.write.assert_awaited_once_with(b"abcdef")
+    assert not handler._request_buffer
+    assert handler._request_writing is False
@@ -92,11 +92,9 @@ def db():
 
 
 @pytest.fixture
-def temp_root():
+def temp_root(tmp_path):
     """Temporary directory for file-operation tests."""
-    d = tempfile.mkdtemp(prefix="aird_test_")
-    yield d
-    shutil.rmtree(d, ignore_errors=True)
+    return str(tmp_path)
 
 
 def _mock_handler(host="localhost:8000", protocol="http", allow_dev=False):
@@ -80,9 +80,9 @@ class TestSuperSearchWebSocketHandler:
             mock_path.return_value.resolve.return_value = "/root"
             mock_path.return_value.__truediv__.return_value = mock_file_path
 
-            # Mock aiofiles.open async context manager and file with readline
+            # Mock aiofiles.open async context manager and file with read
             mock_file = MagicMock()
-            mock_file.readline = AsyncMock(side_effect=["line with search_text\n", ""])
+            mock_file.read = AsyncMock(side_effect=["line with search_text\n", ""])
             mock_cm = MagicMock()
             mock_cm.__aenter__ = AsyncMock(return_value=mock_file)
             mock_cm.__aexit__ = AsyncMock(return_value=False)
@@ -192,16 +192,16 @@ class TestSuperSearchWebSocketHandler:
 
         path_cls = MagicMock(return_value=root_mock)
 
-        # aiofiles.open returns an async context manager; mock file has async readline
+        # aiofiles.open returns an async context manager; mock file has async read
         lines = list(file_lines or [])
         normalized = [line if line.endswith("\n") else line + "\n" for line in lines]
-        line_iter = iter(normalized + [""])
+        block_iter = iter(["".join(normalized)] if normalized else [])
 
-        async def mock_readline():
-            return next(line_iter, "")
+        async def mock_read(_size=-1):
+            return next(block_iter, "")
 
         mock_file = MagicMock()
-        mock_file.readline = AsyncMock(side_effect=mock_readline)
+        mock_file.read = AsyncMock(side_effect=mock_read)
 
         async def mock_aenter():
             return mock_file
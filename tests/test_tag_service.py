@@ -1,19 +1,13 @@
 """Tests for TagService glob-based tag resolution."""
 
-import sqlite3
-
 import pytest
 
-from aird.db import init_db
 from aird.services.tag_service import TagService
 
 
 @pytest.fixture
-def conn():
-    c = sqlite3.connect(":memory:")
-    init_db(c)
-    yield c
-    c.close()
+def conn(schema_db):
+    return schema_db
 
 
 def test_apply_creates_rule_and_returns_id(conn):
@@ -3,12 +3,10 @@
 from __future__ import annotations
 
 import copy
-import sqlite3
 
 import pytest
 
 import aird.constants as constants
-from aird.db import init_db
 from aird.db.config import load_server_config
 from aird.db.ranged_uploads import create_session, get_session
 from aird.services.config_service import ConfigService
@@ -28,11 +26,8 @@ def _restore_runtime(monkeypatch):
 
 
 @pytest.fixture
-def conn():
-    db = sqlite3.connect(":memory:")
-    init_db(db)
-    yield db
-    db.close()
+def conn(schema_db):
+    return schema_db
 
 
 def test_cloudflare_strategy_caps_requests_below_100_mb():
@@ -5,6 +5,9 @@ import tempfile
 import sqlite3
 import time
 from unittest.mock import patch, MagicMock
+
+import pytest
+
 from aird.core.security import (  # noqa: F401
     is_within_root,
     is_valid_websocket_origin,
@@ -78,6 +81,11 @@ class TestGetFileIcon:
         """Test Dockerfile icon"""
         assert "🐳" in get_file_icon("Dockerfile")
 
+    def test_uppercase_extension_icon(self):
+        """Test extension lookup is case-insensitive"""
+        assert "🎬" in get_file_icon("CLIP.MKV")
+        assert "🐍" in get_file_icon("Script.PY")
+
     def test_default_icon(self):
         """Test default icon for unknown extension"""
         assert get_file_icon("unknown.xyz") == "📦"
@@ -490,26 +498,19 @@ class TestGetCurrentWebsocketConfig:
 class TestIsFeatureEnabled:
     """Tests for is_feature_enabled function"""
 
-    def test_is_feature_enabled_default_false(self):
-        """Test default value is False"""
-        with patch("aird.utils.util.get_current_feature_flags", return_value={}):
-            result = is_feature_enabled("nonexistent_feature")
-            assert result is False
-
-    def test_is_feature_enabled_from_flags(self):
-        """Test reading from feature flags"""
-        with patch(
-            "aird.utils.util.get_current_feature_flags",
-            return_value={"my_feature": True},
-        ):
-            result = is_feature_enabled("my_feature")
-            assert result is True
-
-    def test_is_feature_enabled_custom_default(self):
-        """Test custom default value"""
-        with patch("aird.utils.util.get_current_feature_flags", return_value={}):
-            result = is_feature_enabled("nonexistent_feature", default=True)
-            assert result is True
+    @pytest.mark.parametrize(
+        "flags, name, kwargs, expected",
+        [
+            pytest.param({}, "nonexistent_feature", {}, False, id="default_false"),
+            pytest.param({"my_feature": True}, "my_feature", {}, True, id="from_flags"),
+            pytest.param(
+                {}, "nonexistent_feature", {"default": True}, True, id="custom_default"
+            ),
+        ],
+    )
+    def test_is_feature_enabled(self, flags, name, kwargs, expected):
+        with patch("aird.utils.util.get_current_feature_flags", return_value=flags):
+            assert is_feature_enabled(name, **kwargs) is expected
 
 
 class TestLoadShares:
@@ -597,6 +598,34 @@ class TestLoadShares:
         assert result["share1"]["secret_token"] is None
         conn.close()
 
+    def test_load_shares_partial_schema_defaults_missing_columns(self):
+        """Columns absent from an intermediate schema come back as NULL defaults"""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""
+            CREATE TABLE shares (
+                id TEXT PRIMARY KEY,
+                created TEXT,
+                paths TEXT,
+                allowed_users TEXT,
+                share_type TEXT
+            )
+        """)
+        conn.execute("""
+            INSERT INTO shares VALUES (
+                'share1', '2024-01-01', '["a.txt"]', '["user1"]', NULL
+            )
+        """)
+        conn.commit()
+
+        result = _load_shares(conn)
+
+        assert result["share1"]["allowed_users"] == ["user1"]
+        assert result["share1"]["share_type"] == "static"
+        assert result["share1"]["allow_list"] == []
+        assert result["share1"]["avoid_list"] == []
+        assert result["share1"]["expiry_date"] is None
+        conn.close()
+
     def test_load_shares_invalid_json(self):
         """Test loading shares with invalid JSON in paths"""
         conn = sqlite3.connect(":memory:")
@@ -618,6 +647,30 @@ class TestLoadShares:
         assert result["share1"]["paths"] == []
         conn.close()
 
+    def test_load_shares_json_null_uses_defaults(self):
+        """A literal JSON null in list columns yields the column default"""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""
+            CREATE TABLE shares (
+                id TEXT PRIMARY KEY,
+                created TEXT,
+                paths TEXT,
+                allowed_users TEXT,
+                allow_list TEXT
+            )
+        """)
+        conn.execute("""
+            INSERT INTO shares VALUES ('share1', '2024-01-01', 'null', 'null', '[broken')
+        """)
+        conn.commit()
+
+        result = _load_shares(conn)
+
+        assert result["share1"]["paths"] == []
+        assert result["share1"]["allowed_users"] is None
+        assert result["share1"]["allow_list"] == []
+        conn.close()
+
 
 class TestFilterExpression:
     """Tests for FilterExpression class"""
@@ -126,13 +126,17 @@ class TestMainHandler:
             handler, "set_header"
         ) as mock_header, patch.object(
             handler, "write"
-        ) as mock_write, patch.object(handler, "flush", new_callable=AsyncMock):
+        ) as mock_write, patch.object(
+            handler, "flush", new_callable=AsyncMock
+        ) as mock_flush:
 
             await handler.get("file.txt")
 
             mock_header.assert_any_call("Content-Encoding", "gzip")
+            mock_header.assert_any_call("Content-Length", "13")
             mock_write.assert_called_once()
             assert mock_write.call_args[0][0].startswith(b"\x1f\x8b")
+            mock_flush.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_serve_file_download_no_compression(self):
@@ -410,6 +414,132 @@ class TestMainHandler:
             mock_write.assert_called_with(b"content")
 
 
+    @pytest.mark.asyncio
+    async def test_serve_file_raw_head_sets_length_without_body(self):
+        handler = MainHandler(self.mock_app, self.mock_request)
+        handler._current_user = {"username": "user"}
+        self.mock_request.method = "HEAD"
+
+        def get_arg(name, default=None):
+            if name == "mode":
+                return "raw"
+            return default
+
+        handler.get_argument = get_arg
+
+        with patch("os.path.abspath", return_value="/root/file.txt"), patch(
+            "aird.handlers.view_handlers.is_within_root", return_value=True
+        ), patch("os.path.isdir", return_value=False), patch(
+            "os.path.isfile", return_value=True
+        ), patch(
+            "os.path.getsize", return_value=100
+        ), patch(
+            "mimetypes.guess_type", return_value=("text/plain", None)
+        ), patch(
+            "aird.handlers.view_handlers.get_user_root", return_value="/root"
+        ), patch.object(
+            handler, "write"
+        ) as mock_write, patch.object(
+            handler, "set_header"
+        ) as mock_set_header:
+            await handler.head("file.txt")
+
+            mock_set_header.assert_any_call("Content-Length", "100")
+            mock_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_serve_file_raw_error_drops_content_length(self):
+        handler = MainHandler(self.mock_app, self.mock_request)
+        handler._current_user = {"username": "user"}
+        self.mock_request.method = "GET"
+
+        def get_arg(name, default=None):
+            if name == "mode":
+                return "raw"
+            return default
+
+        handler.get_argument = get_arg
+        seen_end = []
+
+        async def failing_chunks(path, start=0, end=None):
+            seen_end.append(end)
+            raise OSError("unreadable")
+            yield b""
+
+        with patch("os.path.abspath", return_value="/root/file.txt"), patch(
+            "aird.handlers.view_handlers.is_within_root", return_value=True
+        ), patch("os.path.isdir", return_value=False), patch(
+            "os.path.isfile", return_value=True
+        ), patch(
+            "os.path.getsize", return_value=100
+        ), patch(
+            "mimetypes.guess_type", return_value=("text/plain", None)
+        ), patch(
+            "aird.handlers.view_handlers.get_user_root", return_value="/root"
+        ), patch(
+            "aird.handlers.view_handlers.MMapFileHandler.serve_file_chunk",
+            side_effect=failing_chunks,
+        ), patch.object(
+            handler, "write"
+        ) as mock_write, patch.object(
+            handler, "set_status"
+        ) as mock_status, patch.object(
+            handler, "clear_header"
+        ) as mock_clear_header:
+            await handler.get("file.txt")
+
+            assert seen_end == [99]
+            mock_clear_header.assert_called_with("Content-Length")
+            mock_status.assert_called_with(500)
+            mock_write.assert_called_with("Error serving file")
+
+    @pytest.mark.asyncio
+    async def test_serve_file_raw_error_after_flush_closes_connection(self):
+        handler = MainHandler(self.mock_app, self.mock_request)
+        handler._current_user = {"username": "user"}
+        self.mock_request.method = "GET"
+
+        def get_arg(name, default=None):
+            if name == "mode":
+                return "raw"
+            return default
+
+        handler.get_argument = get_arg
+
+        async def failing_after_first_chunk(path, start=0, end=None):
+            yield b"first"
+            raise OSError("read failed")
+
+        async def fake_flush():
+            handler._headers_written = True
+
+        with patch("os.path.abspath", return_value="/root/file.txt"), patch(
+            "aird.handlers.view_handlers.is_within_root", return_value=True
+        ), patch("os.path.isdir", return_value=False), patch(
+            "os.path.isfile", return_value=True
+        ), patch(
+            "os.path.getsize", return_value=100
+        ), patch(
+            "mimetypes.guess_type", return_value=("text/plain", None)
+        ), patch(
+            "aird.handlers.view_handlers.get_user_root", return_value="/root"
+        ), patch(
+            "aird.handlers.view_handlers.MMapFileHandler.serve_file_chunk",
+            side_effect=failing_after_first_chunk,
+        ), patch.object(
+            handler, "write"
+        ) as mock_write, patch.object(
+            handler, "flush", side_effect=fake_flush
+        ), patch.object(
+            handler, "set_status"
+        ) as mock_status:
+            await handler.get("file.txt")
+
+            mock_write.assert_called_once_with(b"first")
+            mock_status.assert_not_called()
+            self.mock_request.connection.close.assert_called_once()
+
+
 class TestEditViewHandler:
     def setup_method(self):
         self.mock_app = MagicMock()
@@ -374,6 +374,28 @@ class TestWebSocketConnectionManager:
             conn1.write_message.assert_called_with("test message")
             conn2.write_message.assert_not_called()
 
+    def test_broadcast_message_survives_removal_during_write(self, manager):
+        """A connection dropped from inside write_message must not break the loop"""
+        with patch(
+            "aird.utils.util.get_current_websocket_config",
+            return_value={"test_max_connections": 10},
+        ):
+            closing = MagicMock()
+            closing.ws_connection = MagicMock()
+            closing.write_message.side_effect = lambda _m: manager.remove_connection(
+                closing
+            )
+            other = MagicMock()
+            other.ws_connection = MagicMock()
+
+            manager.add_connection(closing)
+            manager.add_connection(other)
+
+            manager.broadcast_message("test message")
+
+            other.write_message.assert_called_with("test message")
+            assert closing not in manager.connections
+
     # def test_broadcast_message_removes_dead_connections(self, manager):
     #     """Should remove connections that fail during broadcast"""
     #     with patch('aird.core.websocket_manager.get_current_websocket_config',
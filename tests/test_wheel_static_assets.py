@@ -99,18 +99,24 @@ def test_package_data_exists_in_source_tree(rel: str) -> None:
     assert (ROOT / rel).is_file(), f"missing source asset: {rel}"
 
 
+@pytest.mark.slow
+@pytest.mark.integration
 def test_built_wheel_includes_all_package_data(built_wheel: Path) -> None:
     members = _wheel_members(built_wheel)
     missing = sorted(_source_package_data_paths() - members)
     assert not missing, f"wheel missing package data ({len(missing)}):\n" + "\n".join(missing)
 
 
+@pytest.mark.slow
+@pytest.mark.integration
 def test_built_wheel_includes_all_python_modules(built_wheel: Path) -> None:
     members = _wheel_members(built_wheel)
     missing = sorted(_source_python_modules() - members)
     assert not missing, f"wheel missing python modules ({len(missing)}):\n" + "\n".join(missing)
 
 
+@pytest.mark.slow
+@pytest.mark.integration
 def test_built_wheel_includes_template_referenced_static_assets(built_wheel: Path) -> None:
     members = _wheel_members(built_wheel)
     refs = _template_referenced_static_paths()